@@ -0,0 +1,199 @@
+"""Банк заранее сгенерированных и проверенных полей
+
+Поля генерируются и оцениваются заранее (офлайн или в фоне) и хранятся в
+локальном файле SQLite в компактном виде: раскладка по полбайта на клетку,
+начальная клетка и метаданные. Выборка следующего поля - поиск по индексу
+(размер, число цветов, уровень сложности), без какого-либо поиска ходов.
+Поля, совпадающие с точностью до поворота, отражения, перекраски и обмена
+форм (см. symmetry.py), хранятся один раз.
+
+Заполнить банк офлайн:
+
+    python bank.py --size 4 --count 5000
+"""
+import argparse
+import os
+import sqlite3
+import threading
+
+from difficulty import rate_boards
+from engine import Board
+from generator import BoardGenerator
+from palette import DEFAULT_PALETTE
+from symmetry import canonical_key
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "boards.db")
+
+# До какого размера поля при пополнении оценивается сложность
+RATE_MAX_SIZE = 6
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    id INTEGER PRIMARY KEY,
+    size INTEGER NOT NULL,
+    n_colors INTEGER NOT NULL,
+    tier TEXT,
+    start INTEGER NOT NULL,
+    layout BLOB NOT NULL,
+    win_rate REAL,
+    solutions INTEGER,
+    canonical BLOB
+);
+CREATE INDEX IF NOT EXISTS boards_lookup ON boards (size, n_colors, tier, id);
+-- Выборка без уровня сложности: по порядку id без сортировки
+CREATE INDEX IF NOT EXISTS boards_order ON boards (size, n_colors, id);
+"""
+
+# Уникальность класса эквивалентности; создается после миграции старых банков
+CANONICAL_INDEX = """
+CREATE UNIQUE INDEX IF NOT EXISTS boards_canonical ON boards (size, n_colors, canonical);
+"""
+
+
+class BoardBank:
+    """Банк полей в файле SQLite; одно соединение - один поток"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(boards)")}
+        if "canonical" not in columns:
+            self._add_canonical()
+        self.db.executescript(CANONICAL_INDEX)
+
+    def _add_canonical(self):
+        """Миграция банка без столбца canonical: заполняет его и удаляет дубликаты"""
+        with self.db:
+            self.db.execute("ALTER TABLE boards ADD COLUMN canonical BLOB")
+            seen = set()
+            rows = self.db.execute("SELECT id, size, n_colors, start, layout FROM boards").fetchall()
+            for row_id, size, n_colors, start, layout in rows:
+                key = canonical_key(Board.decode(size, layout, start))
+                if (size, n_colors, key) in seen:
+                    self.db.execute("DELETE FROM boards WHERE id = ?", (row_id,))
+                else:
+                    seen.add((size, n_colors, key))
+                    self.db.execute("UPDATE boards SET canonical = ? WHERE id = ?", (key, row_id))
+
+    def close(self):
+        self.db.close()
+
+    def _where(self, size, n_colors, tier):
+        if tier is None:
+            return "size = ? AND n_colors = ?", (size, n_colors)
+        return "size = ? AND n_colors = ? AND tier = ?", (size, n_colors, tier)
+
+    def count(self, size, n_colors, tier=None):
+        where, params = self._where(size, n_colors, tier)
+        return self.db.execute(f"SELECT COUNT(*) FROM boards WHERE {where}", params).fetchone()[0]
+
+    def add(self, boards, n_colors, reports=None):
+        """Сохраняет поля; reports - оценки сложности (DifficultyReport) тех же полей
+
+        Поля, эквивалентные уже лежащим в банке, пропускаются; возвращает
+        число добавленных.
+        """
+        rows = []
+        for i, board in enumerate(boards):
+            report = reports[i] if reports else None
+            rows.append((
+                board.size, n_colors,
+                report.tier if report else None,
+                board.start, board.encode(),
+                report.win_rate() if report else None,
+                report.solutions if report else None,
+                canonical_key(board),
+            ))
+        with self.db:
+            cursor = self.db.executemany(
+                "INSERT OR IGNORE INTO boards "
+                "(size, n_colors, tier, start, layout, win_rate, solutions, canonical) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return cursor.rowcount
+
+    def take(self, size, n_colors, tier=None):
+        """Забирает из банка следующее поле или возвращает None, если банк пуст"""
+        where, params = self._where(size, n_colors, tier)
+        with self.db:
+            row = self.db.execute(
+                f"SELECT id, start, layout FROM boards WHERE {where} ORDER BY id LIMIT 1",
+                params).fetchone()
+            if row is None:
+                return None
+            self.db.execute("DELETE FROM boards WHERE id = ?", (row[0],))
+        return Board.decode(size, row[2], row[1])
+
+    def top_up(self, size, n_colors, target, batch=100, seed=None):
+        """Догенерирует поля, пока в банке не станет target штук; возвращает число новых
+
+        Останавливается раньше, если очередная порция не добавила ни одного
+        поля: различных с точностью до симметрии полей может быть меньше target.
+        """
+        generator = BoardGenerator(size, n_colors, seed=seed)
+        added = 0
+        missing = target - self.count(size, n_colors)
+        while missing > 0:
+            boards = [generator.generate() for _ in range(min(batch, missing))]
+            reports = None
+            if size <= RATE_MAX_SIZE:
+                reports = rate_boards(boards, playouts=200, workers=0, solution_nodes=2000)
+            new = self.add(boards, n_colors, reports)
+            if not new:
+                break
+            added += new
+            missing = target - self.count(size, n_colors)
+        return added
+
+
+class BankRefiller:
+    """Фоновое пополнение банка, когда в нем остается мало полей"""
+
+    def __init__(self, path, size, n_colors, low_water=20, target=200):
+        self.path = path
+        self.size = size
+        self.n_colors = n_colors
+        self.low_water = low_water
+        self.target = target
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def check(self, available):
+        """Запускает пополнение, если полей меньше low_water и оно еще не идет"""
+        if available >= self.low_water or self.running:
+            return False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return True
+
+    def _run(self):
+        # У фонового потока свое соединение с базой
+        bank = BoardBank(self.path)
+        try:
+            bank.top_up(self.size, self.n_colors, self.target)
+        finally:
+            bank.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Заполнение банка полей")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="файл банка")
+    parser.add_argument("--size", type=int, default=4, help="размер поля")
+    parser.add_argument("--colors", type=int, default=len(DEFAULT_PALETTE), help="число цветов")
+    parser.add_argument("--count", type=int, default=1000, help="сколько полей должно быть в банке")
+    parser.add_argument("--seed", type=int, default=None, help="зерно генератора")
+    args = parser.parse_args(argv)
+
+    bank = BoardBank(args.path)
+    added = bank.top_up(args.size, args.colors, args.count, seed=args.seed)
+    print(f"Добавлено полей: {added}, всего {args.size}x{args.size}: "
+          f"{bank.count(args.size, args.colors)}")
+    bank.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Пакетная оценка тысяч полей сразу на NumPy
+
+Поля одного размера N хранятся массивами (B, N, N): индексы цветов и биты
+форм. Позиции - массив зачеркнутых (B, N*N) типа bool и последние клетки
+(B,). Допустимые ходы и доигрывания считаются сразу для всех полей пачки
+векторными операциями: на каждом шаге смотрятся только 2N-2 клетки строки
+и столбца последней зачеркнутой, поэтому шаг стоит O(B*N), а не O(B*N*N).
+
+NumPy - необязательная зависимость: модуль нужен только для аналитики и
+замеров, игра и генератор без него работают.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from engine import Board
+
+POLICIES = ("random", "greedy")
+
+
+@lru_cache(maxsize=None)
+def line_index(size):
+    """Для каждой клетки индексы 2N-2 клеток ее строки и столбца, (N*N, 2N-2)"""
+    cells = np.arange(size * size)
+    rows, cols = np.divmod(cells, size)
+    others = np.arange(size - 1)
+    # Клетки строки и столбца, пропуская саму клетку
+    row_cols = others[None, :] + (others[None, :] >= cols[:, None])
+    col_rows = others[None, :] + (others[None, :] >= rows[:, None])
+    index = np.concatenate([rows[:, None] * size + row_cols, col_rows * size + cols[:, None]], axis=1)
+    index.setflags(write=False)
+    return index
+
+
+def masks_to_array(masks, cells):
+    """Маски-числа (как Engine.crossed) -> массив (B, cells) типа bool"""
+    data = b"".join(mask.to_bytes((cells + 7) // 8, "little") for mask in masks)
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8).reshape(len(masks), -1),
+                         axis=1, bitorder="little")
+    return bits[:, :cells].astype(bool)
+
+
+def array_to_masks(array):
+    """Массив (B, cells) типа bool -> список масок-чисел"""
+    packed = np.packbits(array, axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+class BoardBatch:
+    """Пачка полей одного размера для векторной оценки"""
+
+    def __init__(self, colors, shapes, starts=None):
+        colors = np.asarray(colors)
+        shapes = np.asarray(shapes)
+        if colors.ndim != 3 or colors.shape[1] != colors.shape[2] or colors.shape != shapes.shape:
+            raise ValueError("Ожидаются массивы цветов и форм формы (B, N, N)")
+        self.count, self.size = colors.shape[:2]
+        self.cells = self.size * self.size
+        self.colors = colors.reshape(self.count, self.cells).astype(np.int16)
+        self.shapes = shapes.reshape(self.count, self.cells).astype(np.int8)
+        self.starts = None if starts is None else np.asarray(starts, dtype=np.intp)
+        self.lines = line_index(self.size)
+        self._rows = np.arange(self.count)
+        self._line_compat = None
+
+    @classmethod
+    def from_boards(cls, boards):
+        """Пачка из списка Board одного размера (с их начальными клетками)"""
+        size = boards[0].size
+        shape = (len(boards), size, size)
+        colors = np.array([board.colors for board in boards]).reshape(shape)
+        shapes = np.array([board.shapes for board in boards]).reshape(shape)
+        return cls(colors, shapes, [board.start for board in boards])
+
+    def board(self, index):
+        """Поле index пачки как Board"""
+        start = 0 if self.starts is None else int(self.starts[index])
+        return Board(self.size, self.colors[index].tolist(), self.shapes[index].tolist(), start)
+
+    def _starts(self, starts=None):
+        starts = self.starts if starts is None else np.asarray(starts, dtype=np.intp)
+        if starts is None:
+            raise ValueError("Не заданы начальные клетки")
+        return starts
+
+    def initial(self, starts=None):
+        """Начальные позиции: (crossed, last)"""
+        starts = self._starts(starts)
+        crossed = np.zeros((self.count, self.cells), dtype=bool)
+        crossed[self._rows, starts] = True
+        return crossed, starts.copy()
+
+    @property
+    def line_compat(self):
+        """Совместимость клетки с клетками ее линий, (B, N*N, 2N-2) типа bool"""
+        if self._line_compat is None:
+            lines = self.lines
+            self._line_compat = ((self.colors[:, lines] == self.colors[:, :, None])
+                                 | (self.shapes[:, lines] == self.shapes[:, :, None]))
+        return self._line_compat
+
+    def legal_moves(self, crossed, last):
+        """Допустимые ходы всех позиций пачки, массив (B, N*N) типа bool"""
+        rows = self._rows[:, None]
+        last = np.asarray(last, dtype=np.intp)
+        candidates = self.lines[last]
+        moves = np.zeros((self.count, self.cells), dtype=bool)
+        moves[rows, candidates] = self.line_compat[self._rows, last] & ~crossed[rows, candidates]
+        return moves
+
+    def _cross(self, crossed, last, degree, rows, cells):
+        """Зачеркивает клетки cells в позициях rows"""
+        crossed[rows, cells] = True
+        last[rows] = cells
+        if degree is not None:
+            # Клетки линий, совместимые с зачеркнутой, теряют одно продолжение
+            degree[rows[:, None], self.lines[cells]] -= self.line_compat[rows, cells]
+
+    def _step(self, crossed, last, degree, rows, rng):
+        """Один ход позиций rows; возвращает позиции, в которых ход был"""
+        ends = last[rows]
+        candidates = self.lines[ends]
+        legal = self.line_compat[rows, ends] & ~crossed[rows[:, None], candidates]
+        moving = legal.any(axis=1)
+        if not moving.all():
+            rows, candidates, legal = rows[moving], candidates[moving], legal[moving]
+
+        # Случайный ключ в [0, 1) разбивает равенства; недопустимые ходы - ниже всех
+        keys = rng.random(legal.shape, dtype=np.float32)
+        if degree is not None:
+            keys += degree[rows[:, None], candidates]
+        keys[~legal] = -1.0
+        choice = candidates[np.arange(rows.size), keys.argmax(axis=1)]
+        self._cross(crossed, last, degree, rows, choice)
+        return rows
+
+    def playouts(self, rng=None, policy="random", starts=None):
+        """Доигрывает по одной партии на каждом поле с начала до конца
+
+        Возвращает (победа (B,) bool, число ходов (B,)).
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Неизвестная стратегия: {policy}")
+        if rng is None:
+            rng = np.random.default_rng()
+        greedy = policy == "greedy"
+        crossed = np.zeros((self.count, self.cells), dtype=bool)
+        last = np.zeros(self.count, dtype=np.intp)
+        # Для greedy: сколько незачеркнутых совместимых клеток у каждой клетки
+        degree = self.line_compat.sum(axis=2, dtype=np.int16) if greedy else None
+        self._cross(crossed, last, degree, self._rows, self._starts(starts))
+
+        rows = self._rows
+        while rows.size:
+            rows = self._step(crossed, last, degree, rows, rng)
+        moves = crossed.sum(axis=1) - 1
+        return moves == self.cells - 1, moves
+
+    def win_rates(self, playouts, rng=None, policy="random"):
+        """Доля побед из playouts доигрываний для каждого поля, (B,)"""
+        if rng is None:
+            rng = np.random.default_rng()
+        wins = np.zeros(self.count)
+        for _ in range(playouts):
+            won, _ = self.playouts(rng, policy)
+            wins += won
+        return wins / playouts
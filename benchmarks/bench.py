@@ -0,0 +1,359 @@
+"""Воспроизводимые замеры производительности горячих путей игры
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.bench                    # замер и сравнение с baseline.json
+    python -m benchmarks.bench --update-baseline  # сохранить текущие числа как эталон
+
+Результаты пишутся в JSON. Если какая-то метрика хуже эталона больше чем на
+допуск, скрипт печатает список регрессий и завершается с кодом 1.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from engine import Engine, ShapeType, iter_cells
+from generator import BoardGenerator
+from palette import DEFAULT_PALETTE
+from solver import Solver
+
+from benchmarks.stubcanvas import StubCanvas, StubPhotoImage
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+RESULTS_PATH = os.path.join(HERE, "results.json")
+
+SEED = 20240601
+N_COLORS = len(DEFAULT_PALETTE)
+MOVE_SIZES = (4, 8, 16)
+GENERATE_SIZES = (4, 6, 8, 16)
+SOLVE_SIZES = (4, 6, 8)
+RENDER_SIZES = (4, 16, 50)
+IMPORT_MODULES = ("task1", "headless", "gui")
+BATCH_SIZES = ((4, 20000), (8, 5000), (16, 1000))
+CELL_SIZE = 100
+MARGIN = 25
+VIEW_SIZE = 640
+# Сколько раз переигрывается партия при замере хода на холсте
+CROSS_REPEAT = 200
+
+
+def best_time(func, number, repeat=5):
+    """Лучшее из repeat время одного вызова func (секунды)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def boards(size, count, seed=SEED):
+    generator = BoardGenerator(size, N_COLORS, seed=seed + size)
+    return [generator.generate() for _ in range(count)]
+
+
+def bench_moves(results):
+    """Генерация ходов и проверка хода: вызовов в секунду"""
+    for size in MOVE_SIZES:
+        engine = Engine(boards(size, 1)[0])
+        cells = range(engine.board.cells)
+
+        def legal_moves():
+            for _ in cells:
+                engine.legal_moves()
+
+        def can_cross():
+            for cell in cells:
+                engine.can_cross(cell)
+
+        per_call = best_time(legal_moves, 200) / len(cells)
+        results[f"moves.legal_moves.{size}"] = (1 / per_call, "calls/s", True)
+        per_call = best_time(can_cross, 200) / len(cells)
+        results[f"moves.can_cross.{size}"] = (1 / per_call, "calls/s", True)
+
+
+def bench_generate(results):
+    """Генерация проходимых полей: полей в секунду"""
+    for size in GENERATE_SIZES:
+        count = 300 if size <= 8 else 100
+
+        def generate():
+            generator = BoardGenerator(size, N_COLORS, seed=SEED)
+            for _ in range(count):
+                generator.generate()
+
+        results[f"generate.{size}"] = (count / best_time(generate, 1), "boards/s", True)
+
+
+def bench_solve(results):
+    """Точный решатель: миллисекунд на поле"""
+    for size in SOLVE_SIZES:
+        sample = boards(size, 100)
+
+        def solve():
+            for board in sample:
+                Solver(board).solve()
+
+        results[f"solve.{size}"] = (best_time(solve, 1) / len(sample) * 1000, "ms/board", False)
+
+
+def make_canvas():
+    """Настоящий холст Tk и фабрика картинок, если есть дисплей, иначе заглушки"""
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        try:
+            import tkinter as tk
+            root = tk.Tk()
+            root.withdraw()
+            canvas = tk.Canvas(root, width=VIEW_SIZE, height=VIEW_SIZE)
+            return canvas, lambda **size: tk.PhotoImage(master=root, **size), "tk"
+        except Exception:
+            pass
+    return StubCanvas(), StubPhotoImage, "stub"
+
+
+def bench_render(results):
+    """Смена поля и зачеркивание: время и число элементов холста
+
+    Метрики render.* - векторные фигуры, render.sprite.* - картинки из
+    SpriteCache (с уже построенными картинками); render.sprite.tile -
+    построение одной картинки.
+    """
+    from sprites import SpriteCache
+
+    backend = None
+    for size in RENDER_SIZES:
+        backend = bench_render_view(results, "render", size, use_sprites=False)
+        bench_render_view(results, "render.sprite", size, use_sprites=True)
+
+    # Картинка строится один раз на сочетание (форма, цвет, состояние)
+    sprites = SpriteCache(CELL_SIZE, StubPhotoImage, DEFAULT_PALETTE)
+    keys = [sprites.key(*figure) for figure in sprite_figures()]
+    elapsed = best_time(lambda: [sprites._render(*key) for key in keys], 1, repeat=3)
+    results["render.sprite.tile"] = (elapsed / len(keys) * 1000, "ms", False)
+    return backend
+
+
+def sprite_figures():
+    """Все различимые сочетания (форма, цвет, зачеркнута, последняя, начальная)"""
+    return [(shape_type, color, crossed, last, start)
+            for shape_type in ShapeType for color in range(N_COLORS)
+            for crossed, last, start in ((False, False, False), (True, False, False),
+                                         (True, True, False), (False, False, True))]
+
+
+def bench_render_view(results, prefix, size, use_sprites):
+    """Замеры BoardView одного способа отрисовки; метрики с префиксом prefix"""
+    from gui import BoardView, RenderStats
+    from sprites import SpriteCache
+
+    canvas, image_factory, backend = make_canvas()
+    stats = RenderStats()
+    sprites = SpriteCache(CELL_SIZE, image_factory, DEFAULT_PALETTE) if use_sprites else None
+    view = BoardView(canvas, size, CELL_SIZE, MARGIN, DEFAULT_PALETTE, stats, sprites)
+    sample = boards(size, 40)
+    rng = random.Random(SEED)
+
+    def show(board):
+        stats.begin_frame()
+        view.show(Engine(board))
+        view.update_viewport(0, 0, VIEW_SIZE, VIEW_SIZE)
+        return stats.end_frame()
+
+    # Первая отрисовка создает элементы (и картинки), следующие их переиспользуют
+    if sprites is not None:
+        for figure in sprite_figures():
+            sprites.tile(*figure)
+    show(sample[0])
+    started = time.perf_counter()
+    created = 0
+    for board in sample[1:]:
+        created += show(board)["created"]
+    reset_ms = (time.perf_counter() - started) / (len(sample) - 1) * 1000
+    results[f"{prefix}.reset.{size}"] = (reset_ms, "ms", False)
+    results[f"{prefix}.reset_created.{size}"] = (created / (len(sample) - 1), "items", False)
+    results[f"{prefix}.live_items.{size}"] = (stats.live_items, "items", False)
+
+    # Случайная партия в пределах видимой области; ход занимает микросекунды,
+    # поэтому партия переигрывается много раз и берется лучшее время
+    engine = view.engine
+    path = []
+    configured = 0
+    while True:
+        moves = [cell for cell in iter_cells(engine.legal_moves()) if cell in view.views]
+        if not moves:
+            break
+        cell = rng.choice(moves)
+        stats.begin_frame()
+        previous = engine.last
+        engine.apply(cell)
+        view.refresh_cell(previous)
+        view.refresh_cell(cell)
+        configured += stats.end_frame()["configured"]
+        path.append(cell)
+
+    if path:
+        board = engine.board
+        best = float("inf")
+        for _ in range(CROSS_REPEAT):
+            engine = Engine(board)
+            view.show(engine)
+            started = time.perf_counter()
+            for cell in path:
+                previous = engine.last
+                engine.apply(cell)
+                view.refresh_cell(previous)
+                view.refresh_cell(cell)
+            best = min(best, time.perf_counter() - started)
+        results[f"{prefix}.cross.{size}"] = (best / len(path) * 1e6, "us", False)
+        results[f"{prefix}.cross_configured.{size}"] = (configured / len(path), "items", False)
+    return backend
+
+
+def import_time(module, repeat=5):
+    """Лучшее время импорта модуля в новом интерпретаторе (мс) и загружен ли tkinter"""
+    code = f"import sys, {module}; print('tkinter' in sys.modules)"
+    best = float("inf")
+    for _ in range(repeat):
+        done = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                              capture_output=True, text=True, cwd=os.path.dirname(HERE))
+        if done.returncode:
+            return None, None
+        # Последняя строка отчета -X importtime - сам модуль с суммарным временем
+        line = next(line for line in reversed(done.stderr.splitlines())
+                    if line.rstrip().endswith(f"| {module}"))
+        best = min(best, int(line.split("|")[1]) / 1000)
+    return best, done.stdout.strip() == "True"
+
+
+def bench_import(results):
+    """Время запуска: импорт точки входа без tkinter и интерфейса с ним"""
+    for module in IMPORT_MODULES:
+        elapsed, tkinter_loaded = import_time(module)
+        if elapsed is None:
+            continue
+        results[f"import.{module}"] = (elapsed, "ms", False)
+        if module != "gui" and tkinter_loaded:
+            print(f"Внимание: import {module} загружает tkinter", file=sys.stderr)
+
+
+def bench_batch(results):
+    """Векторные доигрывания на NumPy против доигрываний через движок: партий в секунду"""
+    import numpy as np
+    from batch import BoardBatch
+    from headless import play_game
+    from strategies import make_strategy
+
+    for size, count in BATCH_SIZES:
+        sample = boards(size, 50)
+        batch = BoardBatch.from_boards([sample[i % len(sample)] for i in range(count)])
+        for policy in ("random", "greedy"):
+            rng = np.random.default_rng(SEED)
+            elapsed = best_time(lambda: batch.playouts(rng, policy), 1, repeat=3)
+            results[f"batch.{policy}.{size}"] = (count / elapsed, "games/s", True)
+
+            strategy = make_strategy(policy, random.Random(SEED))
+            engine_elapsed = best_time(
+                lambda: [play_game(board, strategy) for board in sample], 1, repeat=3)
+            speedup = count / elapsed / (len(sample) / engine_elapsed)
+            results[f"batch.{policy}_speedup.{size}"] = (speedup, "x", True)
+
+
+def run():
+    results = {}
+    skipped = []
+    bench_import(results)
+    skipped.extend(f"import.{module}" for module in IMPORT_MODULES
+                   if f"import.{module}" not in results)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        skipped.append("batch.")
+    else:
+        bench_batch(results)
+    bench_moves(results)
+    bench_generate(results)
+    bench_solve(results)
+    backend = bench_render(results)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "render_backend": backend,
+        "seed": SEED,
+        "skipped": skipped,
+        "metrics": {
+            name: {"value": round(value, 4), "unit": unit, "higher_is_better": higher}
+            for name, (value, unit, higher) in sorted(results.items())
+        },
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Список регрессий относительно эталона"""
+    regressions = []
+    skipped = tuple(current.get("skipped", ()))
+    for name, base in baseline["metrics"].items():
+        # Метрики необязательных зависимостей, которых нет в этом окружении
+        if skipped and name.startswith(skipped):
+            continue
+        metric = current["metrics"].get(name)
+        if metric is None:
+            regressions.append(f"{name}: метрика пропала")
+            continue
+        value, expected = metric["value"], base["value"]
+        if base["higher_is_better"]:
+            worse = value < expected * (1 - tolerance)
+        else:
+            worse = value > expected * (1 + tolerance)
+        if worse:
+            regressions.append(f"{name}: {value:g} {metric['unit']} (эталон {expected:g})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры производительности игры")
+    parser.add_argument("--output", default=RESULTS_PATH, help="куда записать результаты")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="файл эталона")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="записать результаты как новый эталон")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="допустимое ухудшение, доля (по умолчанию 0.3)")
+    args = parser.parse_args(argv)
+
+    current = run()
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=2, ensure_ascii=False)
+
+    for name, metric in current["metrics"].items():
+        print(f"{name:32} {metric['value']:>14,.2f} {metric['unit']}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+        print(f"Эталон обновлен: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Эталон {args.baseline} не найден, сравнение пропущено")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.tolerance)
+    if regressions:
+        print("\nРЕГРЕССИЯ ПРОИЗВОДИТЕЛЬНОСТИ:", file=sys.stderr)
+        for line in regressions:
+            print("  " + line, file=sys.stderr)
+        return 1
+    print("\nРегрессий нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
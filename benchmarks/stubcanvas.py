@@ -0,0 +1,76 @@
+"""Заглушки tk.Canvas и tk.PhotoImage для замеров отрисовки без дисплея
+
+Повторяют только те методы, которые вызывают фигуры, и считают элементы и
+обращения к холсту (каждое - это один вызов Tcl в настоящем Tk).
+"""
+import itertools
+
+
+class StubCanvas:
+    """Холст без отрисовки: хранит элементы и их теги, считает вызовы"""
+
+    def __init__(self):
+        self.items = {}
+        self.calls = 0
+        self._ids = itertools.count(1)
+
+    def _create(self, *coords, tags=(), **options):
+        self.calls += 1
+        item = next(self._ids)
+        self.items[item] = (tags,) if isinstance(tags, str) else tuple(tags)
+        return item
+
+    create_oval = create_rectangle = create_line = create_image = create_text = _create
+
+    def _find(self, tag_or_id):
+        if tag_or_id == "all":
+            return list(self.items)
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [item for item, tags in self.items.items() if tag_or_id in tags]
+
+    def itemconfigure(self, tag_or_id, **options):
+        self.calls += 1
+
+    itemconfig = itemconfigure
+
+    def configure(self, **options):
+        self.calls += 1
+
+    config = configure
+
+    def coords(self, tag_or_id, *coords):
+        self.calls += 1
+
+    def move(self, tag_or_id, dx, dy):
+        self.calls += 1
+
+    def tag_lower(self, tag_or_id, below=None):
+        self.calls += 1
+
+    def tag_raise(self, tag_or_id, above=None):
+        self.calls += 1
+
+    def delete(self, *tags_or_ids):
+        self.calls += 1
+        for tag_or_id in tags_or_ids:
+            for item in self._find(tag_or_id):
+                del self.items[item]
+
+
+class StubPhotoImage:
+    """Картинка без Tk: запоминает размер и число переданных пикселей"""
+
+    def __init__(self, width=0, height=0):
+        self._width = width
+        self._height = height
+        self.pixels = 0
+
+    def put(self, data, to=None):
+        self.pixels += data.count("#")
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
@@ -0,0 +1,198 @@
+"""Клиент сервера партий и генератор нагрузки
+
+GameClient - соединение с server.py: request() отправляет строку JSON и
+ждет ответную. run_load() открывает несколько соединений, каждое играет
+партии до конца (новое поле, ходы, иногда подсказка или отмена), и
+замеряет задержку каждого запроса.
+
+    python client.py --clients 50 --duration 10
+    python client.py --local --clients 50     # сервер в этом же процессе
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from instrument import PERCENTILES, percentile
+from server import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, GameServer
+
+
+class ServerError(Exception):
+    """Сервер ответил ошибкой"""
+
+
+class GameClient:
+    """Одно соединение с сервером; запросы идут по одному"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 1
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def request(self, op, **fields):
+        """Ответ сервера (словарь); ServerError, если сервер ответил ошибкой"""
+        request_id = self.next_id
+        self.next_id += 1
+        fields.update(id=request_id, op=op)
+        self.writer.write(json.dumps(fields, separators=(",", ":")).encode() + b"\n")
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Сервер закрыл соединение")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise ServerError(response.get("error"))
+        return response
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class LoadStats:
+    """Задержки запросов по операциям (мс) и итоги партий"""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = 0
+        self.games = 0
+        self.wins = 0
+        self.elapsed = 0.0
+
+    def add(self, op, ms):
+        self.latencies.setdefault(op, []).append(ms)
+
+    @property
+    def requests(self):
+        return sum(len(values) for values in self.latencies.values())
+
+    def summary(self, op=None):
+        """Число запросов и процентили задержки (по всем операциям, если op=None)"""
+        if op is None:
+            values = sorted(ms for samples in self.latencies.values() for ms in samples)
+        else:
+            values = sorted(self.latencies.get(op, ()))
+        result = {"count": len(values)}
+        for q in PERCENTILES:
+            result[f"p{q}"] = percentile(values, q)
+        result["max"] = values[-1] if values else 0.0
+        return result
+
+
+async def play(client, stats, rng, size, hint_rate, undo_rate, deadline):
+    """Играет партии, пока не выйдет время; каждый запрос замеряется"""
+    clock = time.perf_counter
+
+    async def timed(op, **fields):
+        started = clock()
+        try:
+            return await client.request(op, **fields)
+        except ServerError:
+            stats.errors += 1
+            return None
+        finally:
+            stats.add(op, (clock() - started) * 1000)
+
+    while clock() < deadline:
+        position = await timed("new", size=size)
+        if position is None:
+            return
+        session = position["session"]
+        while position["state"] == "playing" and clock() < deadline:
+            move = None
+            if rng.random() < hint_rate:
+                hinted = await timed("hint", session=session)
+                if hinted is not None and hinted["hint"] is not None:
+                    move = hinted["hint"]["move"]
+            if move is None:
+                move = rng.choice(position["legal"])
+            moved = await timed("move", session=session, cell=move)
+            if moved is not None:
+                position = moved
+            if position["state"] == "playing" and rng.random() < undo_rate:
+                position = await timed("undo", session=session) or position
+        if position["state"] != "playing":
+            stats.games += 1
+            stats.wins += position["state"] == "win"
+        await timed("close", session=session)
+
+
+async def run_load(host=DEFAULT_HOST, port=DEFAULT_PORT, clients=20, duration=5.0, size=4,
+                   hint_rate=0.1, undo_rate=0.05, seed=None):
+    """Нагрузка clients соединениями в течение duration секунд; возвращает LoadStats"""
+    stats = LoadStats()
+    connections = [await GameClient.connect(host, port) for _ in range(clients)]
+    started = time.perf_counter()
+    deadline = started + duration
+    try:
+        await asyncio.gather(*(
+            play(client, stats, random.Random(None if seed is None else f"{seed}:{index}"),
+                 size, hint_rate, undo_rate, deadline)
+            for index, client in enumerate(connections)
+        ))
+    finally:
+        stats.elapsed = time.perf_counter() - started
+        for client in connections:
+            await client.close()
+    return stats
+
+
+async def run_local(port=0, **options):
+    """Нагрузка на сервер, запущенный в этом же процессе (на свободном порту)"""
+    server = GameServer(seed=options.get("seed"))
+    listener = await server.start(DEFAULT_HOST, port)
+    port = listener.sockets[0].getsockname()[1]
+    try:
+        return await run_load(DEFAULT_HOST, port, **options)
+    finally:
+        listener.close()
+        await listener.wait_closed()
+        server.close()
+
+
+def report(stats):
+    print(f"Запросов: {stats.requests:,} за {stats.elapsed:.1f} с "
+          f"({stats.requests / stats.elapsed:,.0f} в секунду), ошибок: {stats.errors}")
+    print(f"Партий: {stats.games}, побед: {stats.wins}")
+    print(f"\n{'операция':10} {'запросов':>9} " + " ".join(f"{f'p{q}, мс':>9}" for q in PERCENTILES)
+          + f" {'max, мс':>9}")
+    for op in [None] + sorted(stats.latencies):
+        summary = stats.summary(op)
+        print(f"{op or 'все':10} {summary['count']:>9,} "
+              + " ".join(f"{summary[f'p{q}']:>9.2f}" for q in PERCENTILES)
+              + f" {summary['max']:>9.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Генератор нагрузки для сервера партий")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="адрес сервера")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="порт сервера")
+    parser.add_argument("--local", action="store_true",
+                        help="запустить сервер в этом же процессе")
+    parser.add_argument("--clients", type=int, default=20, help="число соединений")
+    parser.add_argument("--duration", type=float, default=5.0, help="длительность, секунд")
+    parser.add_argument("--grid-size", type=int, default=4, help="размер поля")
+    parser.add_argument("--hint-rate", type=float, default=0.1,
+                        help="доля ходов, перед которыми просят подсказку")
+    parser.add_argument("--undo-rate", type=float, default=0.05,
+                        help="доля ходов, которые сразу отменяются")
+    parser.add_argument("--seed", type=int, default=None, help="зерно полей и ходов")
+    args = parser.parse_args(argv)
+
+    options = dict(clients=args.clients, duration=args.duration, size=args.grid_size,
+                   hint_rate=args.hint_rate, undo_rate=args.undo_rate, seed=args.seed)
+    if args.local:
+        stats = asyncio.run(run_local(**options))
+    else:
+        stats = asyncio.run(run_load(args.host, args.port, **options))
+    report(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Раннее обнаружение проигранной позиции
+
+После каждого хода проверяются дешевые необходимые условия выигрыша.
+Условия проверяются по порядку, пока какое-нибудь не даст ответ:
+  * у каждой незачеркнутой клетки есть хотя бы один незачеркнутый
+    совместимый сосед (последняя зачеркнутая тоже считается): иначе в нее
+    не войти;
+  * клетка ровно с одним таким соседом может быть только концом пути,
+    поэтому таких клеток не больше одной;
+  * все незачеркнутые клетки достижимы из последней зачеркнутой.
+Число открытых соседей каждой клетки обновляется за O(N) на ход. Точный
+решатель вызывается, только когда дешевые условия ничего не решили, а
+незачеркнутых клеток немного, и с малым бюджетом узлов.
+"""
+from engine import iter_cells
+from solver import Solver, SolverLimitExceeded
+
+# Причины проигрыша
+ISOLATED = "isolated"
+ENDS = "ends"
+UNREACHABLE = "unreachable"
+NO_PATH = "no_path"
+
+# Решатель вызывается, когда незачеркнутых клеток не больше этого числа
+SOLVER_MAX_REMAINING = 36
+# Проверка идет после каждого хода в потоке окна, поэтому бюджет узлов
+# мал (несколько мс на ход): позицию, которую решатель не успел решить,
+# обычно решает проверка через ход-другой
+SOLVER_MAX_NODES = 300
+# Больше стольких проигранных позиций решатель между ходами не хранит
+SOLVER_MAX_LOST = 5000
+
+
+class DeadEnd:
+    """Причина, по которой выигрыш невозможен, и клетки, в которых дело"""
+
+    __slots__ = ("reason", "cells")
+
+    def __init__(self, reason, cells=0):
+        self.reason = reason
+        self.cells = cells  # маска клеток
+
+    def __repr__(self):
+        return f"DeadEnd({self.reason}, cells={list(iter_cells(self.cells))})"
+
+
+class DeadEndDetector:
+    """Инкрементальная проверка позиции (crossed, last) на поле board"""
+
+    def __init__(self, board, crossed=None, last=None, solver_max_remaining=SOLVER_MAX_REMAINING,
+                 solver_nodes=SOLVER_MAX_NODES):
+        self.board = board
+        self.solver_max_remaining = solver_max_remaining
+        self.solver = Solver(board, solver_nodes)
+        self.reset(1 << board.start if crossed is None else crossed,
+                   board.start if last is None else last)
+
+    def reset(self, crossed, last):
+        """Полный пересчет для произвольной позиции (после отмены хода)"""
+        compat = self.board.compat
+        self.crossed = crossed
+        self.last = last
+        self.remaining = self.board.full & ~crossed
+        open_cells = self.remaining | 1 << last
+        self.degree = {}
+        self.ends = 0
+        self.isolated = 0
+        for cell in iter_cells(self.remaining):
+            degree = (compat[cell] & open_cells).bit_count()
+            self.degree[cell] = degree
+            if degree < 2:
+                self.ends |= 1 << cell
+                if not degree:
+                    self.isolated |= 1 << cell
+        self._plan = None
+
+    def cross(self, cell):
+        """Учитывает ход в cell: у соседей прежней последней клетки одним открытым соседом меньше"""
+        previous = self.last
+        bit = 1 << cell
+        self.crossed |= bit
+        self.remaining &= ~bit
+        self.last = cell
+        del self.degree[cell]
+        self.ends &= ~bit
+        self.isolated &= ~bit
+
+        degree = self.degree
+        for neighbour in iter_cells(self.board.compat[previous] & self.remaining):
+            degree[neighbour] -= 1
+            if degree[neighbour] < 2:
+                self.ends |= 1 << neighbour
+                if not degree[neighbour]:
+                    self.isolated |= 1 << neighbour
+
+        # Ход по найденному решателем пути сохраняет позицию выигрышной
+        if self._plan and self._plan[0] == cell:
+            self._plan = self._plan[1:]
+        else:
+            self._plan = None
+
+    def unreachable(self):
+        """Маска незачеркнутых клеток, недостижимых из последней"""
+        compat = self.board.compat
+        remaining = self.remaining
+        seen = 0
+        frontier = compat[self.last] & remaining
+        while frontier:
+            seen |= frontier
+            grown = 0
+            for cell in iter_cells(frontier):
+                grown |= compat[cell]
+            frontier = grown & remaining & ~seen
+        return remaining & ~seen
+
+    def check(self):
+        """DeadEnd, если выигрыш уже невозможен, иначе None
+
+        None не гарантирует выигрыш, если позиция слишком велика для решателя.
+        """
+        if not self.remaining:
+            return None
+        if self.isolated:
+            return DeadEnd(ISOLATED, self.isolated)
+        if self.ends.bit_count() > 1:
+            return DeadEnd(ENDS, self.ends)
+        cut_off = self.unreachable()
+        if cut_off:
+            return DeadEnd(UNREACHABLE, cut_off)
+
+        if self._plan is not None or self.remaining.bit_count() > self.solver_max_remaining:
+            return None
+        self.solver.nodes = 0
+        try:
+            path = self.solver.solve(self.crossed, self.last)
+        except SolverLimitExceeded:
+            return None
+        finally:
+            # Проигранные позиции переиспользуются следующими проверками, но
+            # таблица ограничена: на сервере таких партий тысячи
+            if len(self.solver.lost) > SOLVER_MAX_LOST:
+                self.solver.lost.clear()
+        if path is None:
+            return DeadEnd(NO_PATH)
+        self._plan = path
+        return None
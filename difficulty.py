@@ -0,0 +1,201 @@
+"""Оценка сложности полей методом Монте-Карло
+
+Сложность поля определяется долей случайных и жадных доигрываний,
+заканчивающихся победой, и числом различных выигрышных путей.
+Доигрывания раздаются процессам ProcessPoolExecutor порциями: поля
+передаются каждому процессу один раз при запуске, а порция - это только
+номер поля, стратегия, число партий и зерно генератора. Подсчет
+выигрышных путей поля - такая же единица работы в процессе-исполнителе.
+"""
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine import Board, iter_cells
+from solver import SolverCache, SolverLimitExceeded
+
+POLICIES = ("random", "greedy")
+
+# Уровни сложности: (название, минимальная доля побед случайной игры)
+TIERS = (
+    ("easy", 0.20),
+    ("medium", 0.05),
+    ("hard", 0.01),
+    ("expert", 0.0),
+)
+
+# На полях больше этого размера выигрышные пути не считаются: подсчет
+# почти всегда упирается в лимит узлов решателя
+SOLUTIONS_MAX_SIZE = 4
+
+# Поля, загруженные в процесс-исполнитель при его запуске, и его решатели
+_worker_boards = None
+_worker_solvers = None
+
+
+def playout(board, rng, policy="random"):
+    """Доигрывает партию с начала до конца; True при победе
+
+    random - случайный допустимый ход, greedy - ход, после которого
+    остается больше всего продолжений (при равенстве - случайный).
+    """
+    compat = board.compat
+    crossed = 1 << board.start
+    last = board.start
+    greedy = policy == "greedy"
+    while True:
+        moves = compat[last] & ~crossed
+        if not moves:
+            return crossed == board.full
+        cells = list(iter_cells(moves))
+        if greedy and len(cells) > 1:
+            options = [(compat[cell] & ~crossed & ~(1 << cell)).bit_count() for cell in cells]
+            best = max(options)
+            cells = [cell for cell, count in zip(cells, options) if count == best]
+        last = rng.choice(cells)
+        crossed |= 1 << last
+
+
+def chunk_seed(seed, board_index, policy, chunk):
+    """Зерно порции: не зависит от того, какой процесс ее выполнит"""
+    return f"{seed}:{board_index}:{policy}:{chunk}"
+
+
+def _init_worker(layouts, solution_nodes=None):
+    global _worker_boards, _worker_solvers
+    _worker_boards = [Board(*layout) for layout in layouts]
+    # Эквивалентные по симметрии поля имеют одно и то же число решений
+    _worker_solvers = SolverCache(max_nodes=solution_nodes)
+
+
+def _run_chunk(board_index, policy, count, seed):
+    board = _worker_boards[board_index]
+    rng = random.Random(seed)
+    wins = 0
+    for _ in range(count):
+        wins += playout(board, rng, policy)
+    return wins
+
+
+def _count_solutions(board_index):
+    try:
+        return _worker_solvers.count_solutions(_worker_boards[board_index])
+    except SolverLimitExceeded:
+        return None
+
+
+def wilson_interval(wins, total, z=1.96):
+    """95% доверительный интервал Уилсона для доли побед"""
+    if not total:
+        return 0.0, 1.0
+    p = wins / total
+    denom = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denom
+    half = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def tier_for(random_rate, solutions=None):
+    """Уровень сложности по доле побед случайной игры и числу решений"""
+    index = next(i for i, (_, threshold) in enumerate(TIERS) if random_rate >= threshold)
+    # Единственный выигрышный путь делает поле на уровень сложнее
+    if solutions == 1 and index < len(TIERS) - 1:
+        index += 1
+    return TIERS[index][0]
+
+
+class DifficultyReport:
+    """Результаты доигрываний одного поля"""
+
+    def __init__(self, board):
+        self.board = board
+        self.wins = dict.fromkeys(POLICIES, 0)
+        self.playouts = dict.fromkeys(POLICIES, 0)
+        self.solutions = None
+
+    def win_rate(self, policy="random"):
+        total = self.playouts[policy]
+        return self.wins[policy] / total if total else 0.0
+
+    def interval(self, policy="random"):
+        return wilson_interval(self.wins[policy], self.playouts[policy])
+
+    @property
+    def tier(self):
+        return tier_for(self.win_rate("random"), self.solutions)
+
+    def __repr__(self):
+        rates = ", ".join(f"{policy}={self.win_rate(policy):.3f}" for policy in POLICIES)
+        return f"DifficultyReport({self.tier}: {rates}, solutions={self.solutions})"
+
+
+def rate_boards(boards, playouts=2000, chunk_size=250, workers=None, seed=0,
+                ci_width=None, solution_nodes=20000):
+    """Оценивает сложность каждого поля; возвращает список DifficultyReport
+
+    workers - число процессов (None - по числу ядер, 0 - без пула, в текущем
+    процессе). ci_width - остановить доигрывания стратегии, как только
+    ширина 95% доверительного интервала станет не больше этого значения.
+    solution_nodes - лимит узлов решателя при подсчете выигрышных путей;
+    на полях больше SOLUTIONS_MAX_SIZE пути не считаются.
+    """
+    boards = list(boards)
+    reports = [DifficultyReport(board) for board in boards]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    layouts = [(b.size, b.colors, b.shapes, b.start) for b in boards]
+    initargs = (layouts, solution_nodes)
+    counted = [i for i, board in enumerate(boards) if board.size <= SOLUTIONS_MAX_SIZE]
+    remaining = {(i, policy): playouts for i in range(len(boards)) for policy in POLICIES}
+    chunks = dict.fromkeys(remaining, 0)
+
+    # Без ранней остановки все порции отправляются сразу, иначе - раундами
+    per_round = max(1, workers) if ci_width is not None else math.ceil(playouts / chunk_size)
+
+    def rounds(submit):
+        while remaining:
+            jobs = []
+            for key in remaining:
+                index, policy = key
+                for _ in range(per_round):
+                    count = min(chunk_size, remaining[key])
+                    if not count:
+                        break
+                    remaining[key] -= count
+                    jobs.append((key, count, submit(index, policy, count,
+                                                    chunk_seed(seed, index, policy, chunks[key]))))
+                    chunks[key] += 1
+            yield jobs
+
+            for key in list(remaining):
+                report = reports[key[0]]
+                low, high = report.interval(key[1])
+                if not remaining[key] or (ci_width is not None and high - low <= ci_width):
+                    del remaining[key]
+
+    def collect(key, count, wins):
+        report = reports[key[0]]
+        report.wins[key[1]] += wins
+        report.playouts[key[1]] += count
+
+    if workers == 0:
+        _init_worker(*initargs)
+        for index in counted:
+            reports[index].solutions = _count_solutions(index)
+        for jobs in rounds(_run_chunk):
+            for key, count, wins in jobs:
+                collect(key, count, wins)
+        return reports
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+        # Подсчет решений идет в процессах параллельно с доигрываниями
+        solutions = {pool.submit(_count_solutions, index): index for index in counted}
+        for jobs in rounds(lambda *args: pool.submit(_run_chunk, *args)):
+            owners = {future: (key, count) for key, count, future in jobs}
+            for future in as_completed(owners):
+                collect(*owners[future], future.result())
+        for future, index in solutions.items():
+            reports[index].solutions = future.result()
+    return reports
@@ -0,0 +1,242 @@
+"""Безголовый движок игры «Зачеркни фигуры» (без зависимости от Tk)
+
+Поле хранится компактно: для каждой клетки индекс цвета и бит формы,
+зачеркнутые клетки - битовая маска, последняя зачеркнутая - индекс клетки.
+Клетка (row, col) имеет индекс row * size + col.
+"""
+import random
+from enum import Enum
+from functools import lru_cache
+
+
+class ShapeType(Enum):
+    CIRCLE = "circle"
+    SQUARE = "square"
+
+
+class GameState(Enum):
+    PLAYING = "playing"
+    WIN = "win"
+    LOSE = "lose"
+
+
+# Бит формы -> ShapeType
+SHAPE_TYPES = (ShapeType.CIRCLE, ShapeType.SQUARE)
+CIRCLE = 0
+SQUARE = 1
+
+# Больше цветов компактная запись (Board.encode) не вмещает
+MAX_ENCODED_COLORS = 8
+
+
+def iter_cells(mask):
+    """Перебирает индексы установленных битов маски по возрастанию"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@lru_cache(maxsize=None)
+def line_masks(size):
+    """Для каждой клетки маска ее строки и столбца (без самой клетки)"""
+    row_mask = (1 << size) - 1
+    col_mask = 0
+    for row in range(size):
+        col_mask |= 1 << row * size
+
+    masks = []
+    for cell in range(size * size):
+        row, col = divmod(cell, size)
+        masks.append((row_mask << row * size | col_mask << col) & ~(1 << cell))
+    return tuple(masks)
+
+
+class Board:
+    """Расклад поля: индекс цвета и бит формы для каждой клетки
+
+    При создании строятся маски принадлежности клеток каждому цвету и каждой
+    форме и маска совместимых клеток compat для каждой клетки, поэтому
+    colors и shapes после создания не меняются.
+    """
+
+    __slots__ = ("size", "cells", "full", "colors", "shapes", "start",
+                 "color_masks", "shape_masks", "compat")
+
+    def __init__(self, size, colors, shapes, start):
+        self.size = size
+        self.cells = size * size
+        self.full = (1 << self.cells) - 1
+        self.colors = list(colors)
+        self.shapes = list(shapes)
+        self.start = start
+
+        if len(self.colors) != self.cells or len(self.shapes) != self.cells:
+            raise ValueError("Размер раскладки не совпадает с размером поля")
+        if not 0 <= start < self.cells:
+            raise ValueError("Начальная клетка вне поля")
+
+        self.color_masks = [0] * (max(self.colors) + 1)
+        self.shape_masks = [0, 0]
+        for cell, (color, shape) in enumerate(zip(self.colors, self.shapes)):
+            self.color_masks[color] |= 1 << cell
+            self.shape_masks[shape] |= 1 << cell
+
+        # Клетки на одной линии, совпадающие по цвету или форме
+        self.compat = [
+            line & (self.color_masks[color] | self.shape_masks[shape])
+            for line, color, shape in zip(line_masks(size), self.colors, self.shapes)
+        ]
+
+    @classmethod
+    def random(cls, size, n_colors, rng=random):
+        """Случайное поле: цвет, форма и начальная клетка выбираются равновероятно"""
+        cells = size * size
+        colors = [rng.randrange(n_colors) for _ in range(cells)]
+        shapes = [rng.getrandbits(1) for _ in range(cells)]
+        return cls(size, colors, shapes, rng.randrange(cells))
+
+    @classmethod
+    def decode(cls, size, data, start):
+        """Поле из компактной записи encode()"""
+        cells = size * size
+        colors = []
+        shapes = []
+        for cell in range(cells):
+            nibble = data[cell >> 1] >> (cell & 1) * 4 & 0xF
+            colors.append(nibble >> 1)
+            shapes.append(nibble & 1)
+        return cls(size, colors, shapes, start)
+
+    def encode(self):
+        """Компактная запись раскладки: полбайта на клетку (3 бита цвета и бит формы)
+
+        Начальная клетка и размер в запись не входят.
+        """
+        if max(self.colors) >= MAX_ENCODED_COLORS:
+            raise ValueError(f"Компактная запись поддерживает не больше {MAX_ENCODED_COLORS} цветов")
+        data = bytearray((self.cells + 1) // 2)
+        for cell, (color, shape) in enumerate(zip(self.colors, self.shapes)):
+            data[cell >> 1] |= (color << 1 | shape) << (cell & 1) * 4
+        return bytes(data)
+
+    def copy(self):
+        return Board(self.size, self.colors, self.shapes, self.start)
+
+    def index(self, row, col):
+        return row * self.size + col
+
+    def position(self, cell):
+        """Индекс клетки -> (row, col)"""
+        return divmod(cell, self.size)
+
+    def shape_type(self, cell):
+        return SHAPE_TYPES[self.shapes[cell]]
+
+    def line_cells(self, cell):
+        """Клетки той же строки и того же столбца (без самой клетки)"""
+        return iter_cells(line_masks(self.size)[cell])
+
+    def compatible(self, a, b):
+        """Можно ли перейти из клетки a в клетку b (без учета зачеркнутых)"""
+        return bool(self.compat[a] >> b & 1)
+
+
+class Engine:
+    """Позиция партии на поле Board: маска зачеркнутых и последняя клетка
+
+    Каждый ход записывается в журнал изменений history как пара
+    (клетка, предыдущая последняя клетка), поэтому отмена хода - O(1)
+    и не требует копирования позиции.
+    """
+
+    __slots__ = ("board", "crossed", "last", "history", "redo_stack")
+
+    def __init__(self, board):
+        self.board = board
+        self.reset()
+
+    def reset(self):
+        """Возвращает партию к начальной позиции (зачеркнута только стартовая клетка)"""
+        self.crossed = 1 << self.board.start
+        self.last = self.board.start
+        self.history = []
+        self.redo_stack = []
+
+    @property
+    def moves(self):
+        return len(self.history)
+
+    @property
+    def move_cells(self):
+        """Зачеркнутые ходами клетки по порядку"""
+        return [cell for cell, _ in self.history]
+
+    @property
+    def crossed_count(self):
+        return self.crossed.bit_count()
+
+    def is_crossed(self, cell):
+        return bool(self.crossed >> cell & 1)
+
+    def can_cross(self, cell):
+        """Можно ли зачеркнуть клетку из текущей позиции"""
+        return bool(self.legal_moves() >> cell & 1)
+
+    def legal_moves(self):
+        """Маска клеток, которые можно зачеркнуть следующим ходом"""
+        return self.board.compat[self.last] & ~self.crossed
+
+    def moves_from(self, cell):
+        """Маска незачеркнутых клеток, совместимых с клеткой cell"""
+        return self.board.compat[cell] & ~self.crossed
+
+    def push(self, cell):
+        """Зачеркивает клетку без проверки правил (для перебора в поиске)"""
+        self.history.append((cell, self.last))
+        self.crossed |= 1 << cell
+        self.last = cell
+
+    def pop(self):
+        """Откатывает последний ход; возвращает (клетка, прежняя последняя клетка)"""
+        cell, previous = self.history.pop()
+        self.crossed &= ~(1 << cell)
+        self.last = previous
+        return cell, previous
+
+    def apply(self, cell):
+        """Зачеркивает клетку; ValueError, если ход не по правилам"""
+        if not self.can_cross(cell):
+            raise ValueError(f"Клетку {cell} нельзя зачеркнуть")
+        self.push(cell)
+        self.redo_stack.clear()
+
+    def undo(self):
+        """Отменяет ход; возвращает (клетка, прежняя последняя клетка) или None"""
+        if not self.history:
+            return None
+        cell, previous = self.pop()
+        self.redo_stack.append(cell)
+        return cell, previous
+
+    def redo(self):
+        """Повторяет отмененный ход; возвращает (клетка, прежняя последняя клетка) или None"""
+        if not self.redo_stack:
+            return None
+        previous = self.last
+        cell = self.redo_stack.pop()
+        self.push(cell)
+        return cell, previous
+
+    def is_won(self):
+        return self.crossed == self.board.full
+
+    def is_terminal(self):
+        return self.is_won() or not self.legal_moves()
+
+    def state(self):
+        if self.is_won():
+            return GameState.WIN
+        if not self.legal_moves():
+            return GameState.LOSE
+        return GameState.PLAYING
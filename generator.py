@@ -0,0 +1,133 @@
+"""Генератор гарантированно проходимых полей
+
+Два способа получить поле:
+  * выборка с отбраковкой - кандидаты строятся пачками, отсеиваются дешевыми
+    необходимыми условиями и только потом проверяются точным решателем;
+  * обратное построение - сначала выбирается случайный путь ладьи через все
+    клетки, затем цвета и формы подбираются так, чтобы соседние клетки пути
+    были совместимы. Такое поле проходимо по построению.
+"""
+import random
+import time
+from collections import deque
+
+from engine import Board
+from solver import Solver, SolverLimitExceeded
+
+# До какого размера поля выборка с отбраковкой быстрее обратного построения
+SAMPLING_MAX_SIZE = 6
+
+
+class BoardGenerator:
+    """Генератор проходимых полей заданного размера"""
+
+    def __init__(self, size, n_colors, seed=None, batch_size=16,
+                 max_nodes=2000, method="auto"):
+        if method not in ("auto", "sample", "backward"):
+            raise ValueError(f"Неизвестный способ генерации: {method}")
+        self.size = size
+        self.n_colors = n_colors
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.max_nodes = max_nodes
+        self.method = method
+        self._pending = deque()
+
+        # Статистика
+        self.boards = 0
+        self.candidates = 0
+        self.filtered = 0
+        self.unsolved = 0
+        self.elapsed = 0.0
+
+    @property
+    def boards_per_second(self):
+        return self.boards / self.elapsed if self.elapsed else 0.0
+
+    def generate(self):
+        """Возвращает новое проходимое поле"""
+        started = time.perf_counter()
+        method = self.method
+        if method == "auto":
+            method = "sample" if self.size <= SAMPLING_MAX_SIZE else "backward"
+
+        board = self._sample() if method == "sample" else self._backward()
+
+        self.boards += 1
+        self.elapsed += time.perf_counter() - started
+        return board
+
+    def _candidate_batch(self):
+        """Пачка случайных кандидатов"""
+        rng = self.rng
+        cells = self.size * self.size
+        colors = range(self.n_colors)
+        batch = []
+        for _ in range(self.batch_size):
+            bits = rng.getrandbits(cells)
+            shapes = [bits >> cell & 1 for cell in range(cells)]
+            batch.append(Board(self.size, rng.choices(colors, k=cells), shapes,
+                               rng.randrange(cells)))
+        self.candidates += len(batch)
+        return batch
+
+    def _sample(self):
+        while True:
+            if not self._pending:
+                for board in self._candidate_batch():
+                    solver = Solver(board, self.max_nodes)
+                    if solver.is_dead(1 << board.start, board.start):
+                        self.filtered += 1
+                    else:
+                        self._pending.append(solver)
+
+            while self._pending:
+                solver = self._pending.popleft()
+                try:
+                    if solver.is_winnable():
+                        return solver.board
+                except SolverLimitExceeded:
+                    pass
+                self.unsolved += 1
+
+    def random_path(self):
+        """Случайный путь ладьи, проходящий через все клетки поля"""
+        rng = self.rng
+        size = self.size
+        rows = list(range(size))
+        rng.shuffle(rows)
+
+        path = []
+        col = rng.randrange(size)
+        for row in rows:
+            # Строку начинаем в том же столбце, где закончили предыдущую
+            cols = [c for c in range(size) if c != col]
+            rng.shuffle(cols)
+            cols.insert(0, col)
+            path.extend((row, c) for c in cols)
+            col = cols[-1]
+
+        transpose = rng.getrandbits(1)
+        return [c * size + r if transpose else r * size + c for r, c in path]
+
+    def _backward(self):
+        rng = self.rng
+        cells = self.size * self.size
+        path = self.random_path()
+        colors = [0] * cells
+        shapes = [0] * cells
+
+        previous = None
+        for cell in path:
+            colors[cell] = rng.randrange(self.n_colors)
+            shapes[cell] = rng.getrandbits(1)
+            if previous is not None:
+                # Наследуем от предыдущей клетки пути цвет или форму
+                if rng.getrandbits(1):
+                    colors[cell] = colors[previous]
+                else:
+                    shapes[cell] = shapes[previous]
+            previous = cell
+
+        self.candidates += 1
+        return Board(self.size, colors, shapes, path[0])
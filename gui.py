@@ -0,0 +1,1200 @@
+"""Графический интерфейс игры на Tkinter
+
+Модуль импортирует tkinter при загрузке, поэтому его загружают только при
+запуске окна (см. task1.py); правила и поиск от него не зависят.
+"""
+import tkinter as tk
+from tkinter import messagebox, font, ttk
+import os
+import sqlite3
+import time
+
+from bank import DEFAULT_PATH as DEFAULT_BANK_PATH, BankRefiller, BoardBank
+from deadend import ENDS, ISOLATED, NO_PATH, UNREACHABLE
+from engine import MAX_ENCODED_COLORS, GameState, ShapeType, iter_cells
+from generator import BoardGenerator
+from hints import SearchWorker
+from hittest import HitTester
+from instrument import Instrumentation
+from palette import DEFAULT_PALETTE
+from records import GameRecorder, log_path
+from session import Session
+from sprites import SpriteCache
+from viewport import visible_cells
+
+DEFAULT_RECORDS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Пояснения к досрочному проигрышу (см. deadend.py)
+DEAD_END_MESSAGES = {
+    ISOLATED: "Одну из фигур уже не зачеркнуть: в ее строке и столбце\n"
+              "не осталось подходящих незачеркнутых фигур",
+    ENDS: "Несколько фигур могут быть только последними в цепочке",
+    UNREACHABLE: "Часть фигур отрезана от последней зачеркнутой",
+    NO_PATH: "Ни одна последовательность ходов не зачеркивает все фигуры",
+}
+
+
+class RenderStats:
+    """Счетчики операций с элементами холста: всего и за последний кадр"""
+
+    def __init__(self):
+        self.created = 0
+        self.deleted = 0
+        self.configured = 0
+        self.frames = 0
+        self.last_frame = {"created": 0, "deleted": 0, "configured": 0}
+        self._frame_start = (0, 0, 0)
+        # Instrumentation для замера длительности кадров (None - не замерять)
+        self.instruments = None
+        self._frame_clock = 0.0
+
+    @property
+    def live_items(self):
+        """Сколько элементов фигур сейчас существует на холсте"""
+        return self.created - self.deleted
+
+    def begin_frame(self):
+        self._frame_start = (self.created, self.deleted, self.configured)
+        if self.instruments is not None:
+            self._frame_clock = time.perf_counter()
+
+    def end_frame(self):
+        if self.instruments is not None:
+            self.instruments.add("render", (time.perf_counter() - self._frame_clock) * 1000)
+        created, deleted, configured = self._frame_start
+        self.frames += 1
+        self.last_frame = {
+            "created": self.created - created,
+            "deleted": self.deleted - deleted,
+            "configured": self.configured - configured,
+        }
+        return self.last_frame
+
+
+class Shape:
+    """Фигура на холсте в удерживаемом режиме
+
+    Элементы холста создаются один раз; draw() только меняет координаты,
+    цвета и видимость тех элементов, чье состояние изменилось.
+    """
+
+    def __init__(self, canvas, shape_type, color, row, col, cell_size, margin=0, stats=None,
+                 palette=DEFAULT_PALETTE):
+        self.canvas = canvas
+        self.shape_type = shape_type
+        self.color = color  # индекс цвета в палитре
+        self.palette = palette
+        self.row = row
+        self.col = col
+        self.cell_size = cell_size
+        self.margin = margin
+        self.stats = stats if stats is not None else RenderStats()
+        self.crossed = False
+        self.is_last_crossed = False
+        self.is_starting = False
+
+        # Координаты центра фигуры
+        self.x = col * cell_size + cell_size // 2 + margin
+        self.y = row * cell_size + cell_size // 2 + margin
+        self.radius = cell_size // 3
+
+        # Общий тег всех элементов фигуры и состояние, в котором фигура
+        # была нарисована последний раз
+        self.tag = f"shape{id(self)}"
+        self._drawn = None
+        self._glow_fill = None
+
+        self._create_items()
+        self.draw()
+
+    def _create(self, kind, *coords, **options):
+        self.stats.created += 1
+        return getattr(self.canvas, "create_" + kind)(*coords, state=tk.HIDDEN, tags=self.tag,
+                                                      **options)
+
+    def _configure(self, item, **options):
+        self.stats.configured += 1
+        self.canvas.itemconfigure(item, **options)
+
+    def _create_items(self):
+        """Создает все элементы фигуры (изначально скрытые)"""
+        x, y, radius = self.x, self.y, self.radius
+
+        # Эффект свечения для последней зачеркнутой фигуры - под фигурой
+        self.glow_id = self._create(
+            "oval",
+            x - radius - 8, y - radius - 8,
+            x + radius + 8, y + radius + 8,
+            fill=self.palette.glows[self.color], outline=""
+        )
+        self._glow_fill = self.palette.glows[self.color]
+
+        # Контур и заливка для обеих форм; видна только пара текущей формы
+        self.bodies = {shape_type: self._create_body(shape_type) for shape_type in ShapeType}
+        self.shape_id, self.fill_id = self.bodies[self.shape_type]
+
+        # Пунктирный крестик начальной фигуры
+        start_cross_size = self.cell_size // 4
+        self.start_cross_id1 = self._create(
+            "line",
+            x - start_cross_size, y - start_cross_size,
+            x + start_cross_size, y + start_cross_size,
+            fill="#FF7043", width=3, dash=(4, 2)
+        )
+        self.start_cross_id2 = self._create(
+            "line",
+            x + start_cross_size, y - start_cross_size,
+            x - start_cross_size, y + start_cross_size,
+            fill="#FF7043", width=3, dash=(4, 2)
+        )
+
+        # Крестик зачеркнутой фигуры; размер и цвет задаются в draw()
+        self.cross_id1 = self._create("line", x, y, x, y, capstyle=tk.ROUND)
+        self.cross_id2 = self._create("line", x, y, x, y, capstyle=tk.ROUND)
+
+    def _create_body(self, shape_type):
+        """Контур и заливка формы: овалы для круга, прямоугольники для квадрата"""
+        kind = "oval" if shape_type == ShapeType.CIRCLE else "rectangle"
+        x, y, radius = self.x, self.y, self.radius
+
+        # Внешний контур
+        outline_id = self._create(
+            kind,
+            x - radius, y - radius,
+            x + radius, y + radius,
+            outline=self.palette.outlines[self.color], width=3
+        )
+        # Внутренняя заливка
+        fill_id = self._create(
+            kind,
+            x - radius + 3, y - radius + 3,
+            x + radius - 3, y + radius - 3,
+            fill=self.palette.fills[self.color], outline=""
+        )
+        return outline_id, fill_id
+
+    def draw(self):
+        """Приводит элементы на холсте к текущему состоянию фигуры"""
+        state = (self.shape_type, self.color, self.crossed, self.is_last_crossed, self.is_starting)
+        drawn = self._drawn
+        if state == drawn:
+            return
+        if drawn is None:
+            # Все элементы скрыты
+            drawn = (None, None, False, False, False)
+        self._drawn = state
+
+        # Фигура: при смене формы прячется пара элементов прежней формы
+        if self.shape_type != drawn[0]:
+            if drawn[0] is not None:
+                self._configure(self.shape_id, state=tk.HIDDEN)
+                self._configure(self.fill_id, state=tk.HIDDEN)
+            self.shape_id, self.fill_id = self.bodies[self.shape_type]
+            drawn = (self.shape_type, None) + drawn[2:]
+        palette = self.palette
+        if self.color != drawn[1]:
+            self._configure(self.shape_id, outline=palette.outlines[self.color], state=tk.NORMAL)
+            self._configure(self.fill_id, fill=palette.fills[self.color], state=tk.NORMAL)
+            if palette.glows[self.color] != self._glow_fill:
+                self._glow_fill = palette.glows[self.color]
+                self._configure(self.glow_id, fill=self._glow_fill)
+
+        # Эффект свечения для последней зачеркнутой фигуры
+        glow = self.is_last_crossed and self.crossed
+        if glow != (drawn[3] and drawn[2]):
+            self._configure(self.glow_id, state=tk.NORMAL if glow else tk.HIDDEN)
+
+        # Если это начальная фигура (отмечена крестиком)
+        start = self.is_starting and not self.crossed
+        if start != (drawn[4] and not drawn[2]):
+            start_state = tk.NORMAL if start else tk.HIDDEN
+            self._configure(self.start_cross_id1, state=start_state)
+            self._configure(self.start_cross_id2, state=start_state)
+
+        # Если фигура зачеркнута
+        if self.crossed != drawn[2] or (self.crossed and self.is_last_crossed != drawn[3]):
+            self._draw_cross()
+
+    def _draw_cross(self):
+        if not self.crossed:
+            self._configure(self.cross_id1, state=tk.HIDDEN)
+            self._configure(self.cross_id2, state=tk.HIDDEN)
+            return
+
+        cross_color = "#E53935" if self.is_last_crossed else "#FF7043"
+        cross_size = self.cell_size // 2.2 if self.is_last_crossed else self.cell_size // 3.2
+        width = 5 if self.is_last_crossed else 3
+
+        self.canvas.coords(self.cross_id1,
+                           self.x - cross_size, self.y - cross_size,
+                           self.x + cross_size, self.y + cross_size)
+        self.canvas.coords(self.cross_id2,
+                           self.x + cross_size, self.y - cross_size,
+                           self.x - cross_size, self.y + cross_size)
+        self._configure(self.cross_id1, fill=cross_color, width=width, state=tk.NORMAL)
+        self._configure(self.cross_id2, fill=cross_color, width=width, state=tk.NORMAL)
+
+    def place(self, row, col):
+        """Переносит фигуру со всеми элементами в другую клетку"""
+        x = col * self.cell_size + self.cell_size // 2 + self.margin
+        y = row * self.cell_size + self.cell_size // 2 + self.margin
+        if (x, y) != (self.x, self.y):
+            self.canvas.move(self.tag, x - self.x, y - self.y)
+            self.stats.configured += 1
+        self.row, self.col, self.x, self.y = row, col, x, y
+
+    def hide(self):
+        """Скрывает фигуру, чтобы потом переиспользовать ее элементы"""
+        self._configure(self.tag, state=tk.HIDDEN)
+        self._drawn = None
+
+    def set_figure(self, shape_type, color):
+        """Переиспользует элементы фигуры для новой клетки того же места"""
+        self.shape_type = shape_type
+        self.color = color
+        self.crossed = False
+        self.is_last_crossed = False
+        self.is_starting = False
+
+    def delete(self):
+        """Удаляет все элементы фигуры с холста"""
+        self.canvas.delete(self.tag)
+        self.stats.deleted += 9
+        self._drawn = None
+
+    def contains_point(self, x, y):
+        """Проверяет, находится ли точка внутри фигуры"""
+        if self.shape_type == ShapeType.CIRCLE:
+            return (x - self.x) ** 2 + (y - self.y) ** 2 <= self.radius ** 2
+        else:  # квадрат
+            return (self.x - self.radius <= x <= self.x + self.radius and
+                    self.y - self.radius <= y <= self.y + self.radius)
+
+
+class Sprite:
+    """Фигура одним элементом-картинкой из кеша SpriteCache
+
+    Повторяет интерфейс Shape, который использует BoardView; смена
+    состояния - это только замена картинки элемента.
+    """
+
+    def __init__(self, canvas, shape_type, color, row, col, cell_size, margin=0, stats=None,
+                 sprites=None):
+        self.canvas = canvas
+        self.shape_type = shape_type
+        self.color = color
+        self.sprites = sprites
+        self.cell_size = cell_size
+        self.margin = margin
+        self.stats = stats if stats is not None else RenderStats()
+        self.crossed = False
+        self.is_last_crossed = False
+        self.is_starting = False
+
+        self.row, self.col = row, col
+        self.x, self.y = self._corner(row, col)
+        self._image = None
+        self.stats.created += 1
+        self.item = canvas.create_image(self.x, self.y, anchor=tk.NW, state=tk.HIDDEN)
+        self.draw()
+
+    def _corner(self, row, col):
+        # Картинка занимает клетку без линий сетки
+        return (col * self.cell_size + self.margin + 1, row * self.cell_size + self.margin + 1)
+
+    def draw(self):
+        """Ставит картинку текущего состояния, если она сменилась"""
+        image = self.sprites.tile(self.shape_type, self.color, self.crossed,
+                                  self.is_last_crossed, self.is_starting)
+        if image is not self._image:
+            if self._image is None:
+                self.canvas.itemconfigure(self.item, image=image, state=tk.NORMAL)
+            else:
+                self.canvas.itemconfigure(self.item, image=image)
+            self.stats.configured += 1
+            self._image = image
+
+    def place(self, row, col):
+        x, y = self._corner(row, col)
+        if (x, y) != (self.x, self.y):
+            self.canvas.coords(self.item, x, y)
+            self.stats.configured += 1
+        self.row, self.col, self.x, self.y = row, col, x, y
+
+    def hide(self):
+        self.canvas.itemconfigure(self.item, state=tk.HIDDEN)
+        self.stats.configured += 1
+        self._image = None
+
+    def set_figure(self, shape_type, color):
+        self.shape_type = shape_type
+        self.color = color
+        self.crossed = False
+        self.is_last_crossed = False
+        self.is_starting = False
+
+    def delete(self):
+        self.canvas.delete(self.item)
+        self.stats.deleted += 1
+        self._image = None
+
+
+class BoardView:
+    """Поле движка на холсте: фигуры существуют только для видимых клеток
+
+    С кешем картинок sprites каждая клетка - один элемент-картинка (Sprite),
+    без него - векторная фигура из нескольких элементов (Shape).
+    """
+
+    def __init__(self, canvas, grid_size, cell_size, margin, palette=DEFAULT_PALETTE, stats=None,
+                 sprites=None):
+        self.canvas = canvas
+        self.grid_size = grid_size
+        self.cell_size = cell_size
+        self.margin = margin
+        self.palette = palette
+        self.stats = stats if stats is not None else RenderStats()
+        self.sprites = sprites
+        self.engine = None
+
+        # Фигуры видимых клеток и отложенные для переиспользования фигуры
+        self.views = {}
+        self.free_shapes = []
+        self.grid_drawn = False
+
+    def draw_grid(self):
+        """Рисует игровую сетку"""
+        self.canvas.delete("grid")
+        self.grid_drawn = True
+
+        margin = self.margin
+        board_size = self.grid_size * self.cell_size
+        self.canvas.config(scrollregion=(0, 0, board_size + 2 * margin, board_size + 2 * margin))
+
+        # Фон поля
+        self.canvas.create_rectangle(
+            margin,
+            margin,
+            margin + board_size,
+            margin + board_size,
+            fill="#FAFAFA",
+            outline="#CFD8DC",
+            width=2,
+            tags="grid"
+        )
+
+        # Линии сетки
+        for i in range(1, self.grid_size):
+            # Вертикальные линии
+            x = margin + i * self.cell_size
+            self.canvas.create_line(
+                x, margin,
+                x, margin + board_size,
+                fill="#E0E0E0", width=1, tags="grid"
+            )
+            # Горизонтальные линии
+            y = margin + i * self.cell_size
+            self.canvas.create_line(
+                margin, y,
+                margin + board_size, y,
+                fill="#E0E0E0", width=1, tags="grid"
+            )
+
+        # Сетка всегда под фигурами
+        self.canvas.tag_lower("grid")
+
+    def show(self, engine):
+        """Показывает новую партию, переиспользуя уже видимые фигуры"""
+        self.engine = engine
+        board = engine.board
+        if not self.grid_drawn:
+            self.draw_grid()
+        for cell, shape in self.views.items():
+            shape.set_figure(board.shape_type(cell), board.colors[cell])
+            self.sync_shape(shape, cell)
+
+    def sync_shape(self, shape, cell):
+        """Приводит фигуру к состоянию клетки в движке и перерисовывает ее"""
+        engine = self.engine
+        shape.crossed = engine.is_crossed(cell)
+        shape.is_last_crossed = cell == engine.last
+        shape.is_starting = cell == engine.board.start
+        shape.draw()
+
+    def refresh_cell(self, cell):
+        """Перерисовывает клетку, если она сейчас видна"""
+        shape = self.views.get(cell)
+        if shape is not None:
+            self.sync_shape(shape, cell)
+
+    def update_viewport(self, x0, y0, x1, y1):
+        """Создает или переиспользует фигуры только для клеток в прямоугольнике холста"""
+        visible = visible_cells(x0, y0, x1, y1, self.grid_size, self.cell_size, self.margin)
+
+        # Ушедшие из вида фигуры скрываем и откладываем для повторного использования
+        for cell in [cell for cell in self.views if cell not in visible]:
+            shape = self.views.pop(cell)
+            shape.hide()
+            self.free_shapes.append(shape)
+
+        board = self.engine.board
+        for cell in visible:
+            if cell in self.views:
+                continue
+            row, col = board.position(cell)
+            shape_type = board.shape_type(cell)
+            color = board.colors[cell]
+            if self.free_shapes:
+                shape = self.free_shapes.pop()
+                shape.place(row, col)
+                shape.set_figure(shape_type, color)
+            elif self.sprites is not None:
+                shape = Sprite(self.canvas, shape_type, color, row, col, self.cell_size,
+                               self.margin, self.stats, self.sprites)
+            else:
+                shape = Shape(self.canvas, shape_type, color, row, col, self.cell_size,
+                              self.margin, self.stats, self.palette)
+            self.views[cell] = shape
+            self.sync_shape(shape, cell)
+
+    def set_cell_size(self, cell_size):
+        """Меняет размер клетки: фигуры пересоздаются при следующем update_viewport"""
+        for shape in list(self.views.values()) + self.free_shapes:
+            shape.delete()
+        self.views.clear()
+        self.free_shapes.clear()
+
+        self.cell_size = cell_size
+        if self.sprites is not None:
+            self.sprites.set_cell_size(cell_size)
+        self.draw_grid()
+
+
+class Game:
+    # Обработчики, время которых замеряется при включенной инструментовке
+    TIMED_HANDLERS = ("on_canvas_click", "cross_shape", "reset_game", "undo_move", "redo_move",
+                      "poll_search", "update_viewport", "on_mouse_wheel", "on_zoom")
+
+    def __init__(self, root, grid_size=4, cell_size=100, palette=DEFAULT_PALETTE,
+                 bank_path=DEFAULT_BANK_PATH, records_dir=DEFAULT_RECORDS_DIR,
+                 instruments=None, profile_path=None, use_sprites=True):
+        self.root = root
+        self.root.title("🎯 Зачеркни фигуры")
+        self.root.configure(bg="#F5F7FA")
+
+        # Светлая цветовая палитра
+        self.palette = palette
+        self.COLORS = palette.colors
+
+        # Константы
+        self.GRID_SIZE = grid_size
+        self.CELL_SIZE = cell_size
+        self.MIN_CELL_SIZE = 20
+        self.MAX_CELL_SIZE = 160
+        self.MAX_VIEW_SIZE = 640
+        self.GRID_MARGIN = 25
+        self.INFO_HEIGHT = 200
+        self.SEARCH_POLL_MS = 30
+        self.HINT_TIME = 1.5
+        self.AUTOPLAY_MOVE_TIME = 0.4
+
+        # Шрифты
+        self.title_font = font.Font(family="Arial", size=22, weight="bold")
+        self.normal_font = font.Font(family="Arial", size=11)
+        self.bold_font = font.Font(family="Arial", size=11, weight="bold")
+        self.small_font = font.Font(family="Arial", size=9)
+
+        # Банк и журнал хранят поля в компактной записи: для палитры с большим
+        # числом цветов оба отключены
+        if len(self.COLORS) > MAX_ENCODED_COLORS:
+            bank_path = records_dir = None
+
+        # Банк готовых полей с фоновым пополнением; генератор - запасной
+        # вариант, если банк пуст или недоступен
+        self.generator = BoardGenerator(self.GRID_SIZE, len(self.COLORS))
+        self.bank = None
+        if bank_path is not None:
+            try:
+                self.bank = BoardBank(bank_path)
+            except sqlite3.Error:
+                pass
+        self.refiller = BankRefiller(bank_path, self.GRID_SIZE, len(self.COLORS))
+
+        # Журнал партий: поле и зачеркнутые по порядку клетки
+        self.engine = None
+        self.recorder = None
+        if records_dir is not None:
+            try:
+                self.recorder = GameRecorder(log_path(records_dir, self.GRID_SIZE), self.GRID_SIZE)
+            except (OSError, ValueError):
+                pass
+
+        # Счетчики операций отрисовки
+        self.render_stats = RenderStats()
+
+        # Кеш картинок клеток: клетка - один элемент холста; без него фигуры векторные
+        self.sprites = SpriteCache(self.CELL_SIZE, tk.PhotoImage, palette) if use_sprites else None
+
+        # Замеры отзывчивости (None - выключены и ничего не стоят)
+        self.instruments = instruments
+        self.profile_path = profile_path
+        self._click_started = None
+        if instruments is not None:
+            self.render_stats.instruments = instruments
+            instruments.instrument(self, self.TIMED_HANDLERS)
+        self.hit_tester = HitTester(self.GRID_SIZE, self.CELL_SIZE, self.GRID_MARGIN)
+
+        # Фоновый поиск для подсказок и автоигры
+        self.search = SearchWorker()
+        self.search_started = 0.0
+        self.hint = None
+        self.hint_id = None
+        self.autoplay = False
+        self._poll_id = None
+
+        self.setup_ui()
+        self.reset_game()
+
+    def setup_ui(self):
+        """Создает светлый пользовательский интерфейс"""
+        # Основной контейнер
+        main_container = tk.Frame(self.root, bg="#F5F7FA")
+        main_container.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
+
+        # Верхняя информационная панель
+        self.info_frame = tk.Frame(main_container, bg="#FFFFFF", bd=1, relief=tk.RAISED)
+        self.info_frame.pack(fill=tk.X, pady=(0, 10))
+
+        # Игровое поле
+        self.game_frame = tk.Frame(main_container, bg="#ECEFF1", bd=1, relief=tk.SUNKEN)
+        self.game_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Холст для игрового поля: окно просмотра не больше MAX_VIEW_SIZE,
+        # большие поля прокручиваются
+        view_size = min(self.GRID_SIZE * self.CELL_SIZE + 2 * self.GRID_MARGIN,
+                        self.MAX_VIEW_SIZE)
+
+        canvas_frame = tk.Frame(self.game_frame, bg="#ECEFF1")
+        canvas_frame.pack(expand=True, padx=15, pady=15)
+
+        self.canvas = tk.Canvas(
+            canvas_frame,
+            width=view_size,
+            height=view_size,
+            bg="#FFFFFF",
+            highlightthickness=0
+        )
+        self.canvas.grid(row=0, column=0)
+
+        self.board_view = BoardView(self.canvas, self.GRID_SIZE, self.CELL_SIZE, self.GRID_MARGIN,
+                                    self.palette, self.render_stats, self.sprites)
+
+        # Полосы прокрутки есть всегда: после увеличения масштаба поле может
+        # перестать помещаться в окно просмотра
+        x_scroll = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.on_xview)
+        x_scroll.grid(row=1, column=0, sticky=tk.EW)
+        y_scroll = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.on_yview)
+        y_scroll.grid(row=0, column=1, sticky=tk.NS)
+        self.canvas.config(xscrollcommand=x_scroll.set, yscrollcommand=y_scroll.set)
+
+        # Привязываем обработчики событий
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        self.canvas.bind("<Configure>", self.update_viewport)
+        self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.canvas.bind("<Shift-MouseWheel>", self.on_mouse_wheel)
+        self.canvas.bind("<Control-MouseWheel>", self.on_zoom)
+        for button in ("<Button-4>", "<Button-5>", "<Shift-Button-4>", "<Shift-Button-5>"):
+            self.canvas.bind(button, self.on_mouse_wheel)
+        self.canvas.bind("<Control-Button-4>", self.on_zoom)
+        self.canvas.bind("<Control-Button-5>", self.on_zoom)
+        self.canvas.bind("<Enter>", lambda e: self.canvas.config(cursor="hand2"))
+        self.canvas.bind("<Leave>", lambda e: self.canvas.config(cursor=""))
+        self.root.bind("<Control-z>", lambda e: self.undo_move())
+        self.root.bind("<Control-y>", lambda e: self.redo_move())
+        if self.instruments is not None:
+            self.root.bind("<F12>", lambda e: self.dump_profile())
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Создаем элементы интерфейса
+        self.create_info_panel()
+
+    def create_info_panel(self):
+        """Создает информационную панель"""
+        # Заголовок и статистика
+        header_frame = tk.Frame(self.info_frame, bg="#FFFFFF")
+        header_frame.pack(fill=tk.X, padx=20, pady=15)
+
+        # Заголовок
+        title_label = tk.Label(
+            header_frame,
+            text="🎯 Зачеркни фигуры",
+            font=self.title_font,
+            bg="#FFFFFF",
+            fg="#37474F"
+        )
+        title_label.pack(side=tk.LEFT)
+
+        # Статистика
+        stats_frame = tk.Frame(header_frame, bg="#FFFFFF")
+        stats_frame.pack(side=tk.RIGHT)
+
+        # Ходы
+        moves_frame = tk.Frame(stats_frame, bg="#F0F4F7", relief=tk.RIDGE, bd=1)
+        moves_frame.pack(side=tk.LEFT, padx=5)
+
+        tk.Label(moves_frame, text="ХОДОВ", font=self.small_font,
+                 bg="#F0F4F7", fg="#546E7A").pack(pady=(3, 0))
+        self.moves_label = tk.Label(moves_frame, text="0", font=("Arial", 14, "bold"),
+                                    bg="#F0F4F7", fg="#263238")
+        self.moves_label.pack(pady=(0, 3))
+
+        # Прогресс
+        progress_frame = tk.Frame(stats_frame, bg="#F0F4F7", relief=tk.RIDGE, bd=1)
+        progress_frame.pack(side=tk.LEFT, padx=5)
+
+        tk.Label(progress_frame, text="ПРОГРЕСС", font=self.small_font,
+                 bg="#F0F4F7", fg="#546E7A").pack(pady=(3, 0))
+        self.crossed_label = tk.Label(progress_frame, text="0/16", font=("Arial", 14, "bold"),
+                                      bg="#F0F4F7", fg="#263238")
+        self.crossed_label.pack(pady=(0, 3))
+
+        # Кнопка новой игры
+        self.new_game_btn = tk.Button(
+            stats_frame,
+            text="🔄 Новая игра",
+            command=self.reset_game,
+            font=self.normal_font,
+            bg="#42A5F5",
+            fg="white",
+            activebackground="#2196F3",
+            activeforeground="white",
+            relief=tk.FLAT,
+            padx=12,
+            pady=5
+        )
+        self.new_game_btn.pack(side=tk.LEFT, padx=(10, 0))
+
+        # Подсказка и автоигра
+        controls_frame = tk.Frame(self.info_frame, bg="#FFFFFF")
+        controls_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+
+        self.hint_btn = tk.Button(
+            controls_frame,
+            text="💡 Подсказка",
+            command=self.show_hint,
+            font=self.normal_font,
+            bg="#66BB6A",
+            fg="white",
+            activebackground="#43A047",
+            activeforeground="white",
+            relief=tk.FLAT,
+            padx=12,
+            pady=3
+        )
+        self.hint_btn.pack(side=tk.LEFT)
+
+        self.autoplay_btn = tk.Button(
+            controls_frame,
+            text="▶ Автоигра",
+            command=self.toggle_autoplay,
+            font=self.normal_font,
+            bg="#AB47BC",
+            fg="white",
+            activebackground="#8E24AA",
+            activeforeground="white",
+            relief=tk.FLAT,
+            padx=12,
+            pady=3
+        )
+        self.autoplay_btn.pack(side=tk.LEFT, padx=(10, 0))
+
+        # Отмена и повтор хода
+        self.redo_btn = tk.Button(
+            controls_frame,
+            text="↷ Повторить",
+            command=self.redo_move,
+            font=self.normal_font,
+            bg="#78909C",
+            fg="white",
+            activebackground="#546E7A",
+            activeforeground="white",
+            relief=tk.FLAT,
+            padx=12,
+            pady=3
+        )
+        self.redo_btn.pack(side=tk.RIGHT)
+
+        self.undo_btn = tk.Button(
+            controls_frame,
+            text="↶ Отменить",
+            command=self.undo_move,
+            font=self.normal_font,
+            bg="#78909C",
+            fg="white",
+            activebackground="#546E7A",
+            activeforeground="white",
+            relief=tk.FLAT,
+            padx=12,
+            pady=3
+        )
+        self.undo_btn.pack(side=tk.RIGHT, padx=(0, 10))
+
+        # Отладочная панель замеров (только с инструментовкой)
+        self.debug_label = None
+        if self.instruments is not None:
+            self.debug_label = tk.Label(
+                self.info_frame,
+                text="",
+                font=("Courier", 9),
+                bg="#263238",
+                fg="#B2FF59",
+                justify=tk.LEFT,
+                anchor=tk.W
+            )
+            self.debug_label.pack(fill=tk.X, padx=10, pady=(0, 10))
+
+        # Правила игры
+        rules_frame = tk.Frame(self.info_frame, bg="#FAFBFC", bd=1, relief=tk.SUNKEN)
+        rules_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+
+        rules_label = tk.Label(
+            rules_frame,
+            text="📌 Правила игры:",
+            font=self.bold_font,
+            bg="#FAFBFC",
+            fg="#455A64",
+            anchor=tk.W
+        )
+        rules_label.pack(fill=tk.X, padx=10, pady=(5, 2))
+
+        rules_text = tk.Label(
+            rules_frame,
+            text="1. Зачеркивайте фигуры, находящиеся на одной линии (по горизонтали или вертикали)\n" +
+                 "2. Цвет ИЛИ форма должны совпадать с последней зачеркнутой фигурой\n" +
+                 "3. Начинайте с фигуры, отмеченной крестиком",
+            font=self.small_font,
+            bg="#FAFBFC",
+            fg="#607D8B",
+            justify=tk.LEFT,
+            anchor=tk.W
+        )
+        rules_text.pack(fill=tk.X, padx=10, pady=(0, 5))
+
+    def reset_game(self):
+        """Сбрасывает игру и генерирует новое поле"""
+        self.set_autoplay(False)
+        self.stop_search()
+
+        # Прежнее поле покидается - его партия уходит в журнал
+        self.record_game()
+
+        self.render_stats.begin_frame()
+
+        # Берем готовый проходимый расклад из банка
+        board = self.next_board()
+        self.start_row, self.start_col = board.position(board.start)
+        self.session = Session(board)
+        self.engine = self.session.engine
+
+        # Видимые фигуры переиспользуются для нового расклада
+        self.board_view.show(self.engine)
+        self.update_viewport()
+
+        self.render_stats.end_frame()
+
+        # Обновляем информационную панель
+        self.update_info_panel()
+        if self.debug_label is not None:
+            self.update_debug_overlay()
+
+    def next_board(self):
+        """Следующее поле из банка (или от генератора, если банк пуст)"""
+        if self.bank is not None:
+            n_colors = len(self.COLORS)
+            try:
+                board = self.bank.take(self.GRID_SIZE, n_colors)
+                self.refiller.check(self.bank.count(self.GRID_SIZE, n_colors))
+            except sqlite3.Error:
+                board = None
+            if board is not None:
+                return board
+        return self.generator.generate()
+
+    @property
+    def game_state(self):
+        return self.session.state
+
+    @property
+    def dead_end(self):
+        """Причина раннего проигрыша (DeadEnd) или None"""
+        return self.session.dead_end
+
+    @property
+    def moves(self):
+        return self.engine.moves
+
+    @property
+    def crossed_figures(self):
+        return self.engine.crossed_count
+
+    @property
+    def total_figures(self):
+        return self.engine.board.cells
+
+    def update_viewport(self, event=None):
+        """Подгоняет фигуры под видимую часть холста"""
+        canvas = self.canvas
+        x0 = canvas.canvasx(0)
+        y0 = canvas.canvasy(0)
+        x1 = x0 + max(canvas.winfo_width(), int(canvas["width"]))
+        y1 = y0 + max(canvas.winfo_height(), int(canvas["height"]))
+        self.board_view.update_viewport(x0, y0, x1, y1)
+
+    def set_cell_size(self, cell_size):
+        """Меняет масштаб поля: фигуры пересоздаются под новый размер клетки"""
+        cell_size = max(self.MIN_CELL_SIZE, min(self.MAX_CELL_SIZE, cell_size))
+        if cell_size == self.CELL_SIZE:
+            return
+
+        self.CELL_SIZE = cell_size
+        self.hit_tester = HitTester(self.GRID_SIZE, self.CELL_SIZE, self.GRID_MARGIN)
+        self.hide_hint()
+        self.board_view.set_cell_size(cell_size)
+        self.update_viewport()
+
+    def get_possible_moves(self, from_cell):
+        """Возвращает список клеток, которые можно зачеркнуть после клетки from_cell"""
+        return list(iter_cells(self.engine.moves_from(from_cell)))
+
+    def can_cross(self, cell):
+        """Можно ли зачеркнуть данную клетку из текущей позиции"""
+        return self.session.can_cross(cell)
+
+    def cross_shape(self, cell):
+        """Зачеркиваем фигуру в клетке cell"""
+        if not self.can_cross(cell):
+            # Окно открывается вне обработчика, чтобы не попасть в его замер
+            self.root.after_idle(messagebox.showwarning, "Нельзя зачеркнуть",
+                                 "Эту фигуру нельзя зачеркнуть!\n\n"
+                                 "Фигура должна быть:\n"
+                                 "1. На одной линии с последней зачеркнутой\n"
+                                 "2. Иметь тот же цвет ИЛИ ту же форму")
+            return False
+
+        # Позиция меняется - прежняя подсказка больше не актуальна
+        self.stop_search()
+        self.render_stats.begin_frame()
+
+        # Зачеркиваем фигуру и снимаем пометку "последняя зачеркнутая" с предыдущей
+        previous = self.engine.last
+        self.session.cross(cell)
+        self.board_view.refresh_cell(previous)
+        self.board_view.refresh_cell(cell)
+
+        self.render_stats.end_frame()
+        self.after_move()
+        return True
+
+    def undo_move(self):
+        """Отменяет последний ход; перерисовываются только две затронутые клетки"""
+        if self.autoplay or not self.engine.history:
+            return False
+        self.stop_search()
+        self.render_stats.begin_frame()
+
+        cell, previous = self.session.undo()
+        self.board_view.refresh_cell(cell)
+        self.board_view.refresh_cell(previous)
+
+        self.render_stats.end_frame()
+        self.update_info_panel()
+        return True
+
+    def redo_move(self):
+        """Повторяет отмененный ход"""
+        if self.autoplay or not self.engine.redo_stack:
+            return False
+        self.stop_search()
+        self.render_stats.begin_frame()
+
+        cell, previous = self.session.redo()
+        self.board_view.refresh_cell(previous)
+        self.board_view.refresh_cell(cell)
+
+        self.render_stats.end_frame()
+        self.after_move()
+        return True
+
+    def after_move(self):
+        """Обновляет панель и проверяет окончание игры после хода"""
+        self.update_info_panel()
+
+        # Состояние партии (и ранний проигрыш) уже определила сессия
+        if self.game_state != GameState.PLAYING:
+            self.set_autoplay(False)
+        elif self.autoplay:
+            self.start_search()
+
+        if self.game_state == GameState.WIN:
+            self.show_game_over("🎉 ПОБЕДА!",
+                                f"Поздравляем! Вы зачеркнули все фигуры!\n\n"
+                                f"Ходов сделано: {self.moves}")
+        elif self.dead_end is not None:
+            self.show_game_over("💢 ВЫИГРЫШ НЕВОЗМОЖЕН",
+                                f"{DEAD_END_MESSAGES[self.dead_end.reason]}\n\n"
+                                f"Зачеркнуто фигур: {self.crossed_figures} из {self.total_figures}\n"
+                                f"Ход можно отменить (Ctrl+Z)")
+        elif self.game_state == GameState.LOSE:
+            self.show_game_over("💢 ИГРА ОКОНЧЕНА",
+                                f"Нет возможных ходов!\n\n"
+                                f"Зачеркнуто фигур: {self.crossed_figures} из {self.total_figures}")
+
+    def record_game(self):
+        """Дописывает текущую партию в журнал
+
+        Вызывается, когда поле покидают (новая игра или закрытие окна), поэтому
+        каждое поле записывается один раз - с последним итогом и ходами: проигрыш,
+        отмененный и сменившийся победой, записывается как победа. Партия без
+        ходов не записывается.
+        """
+        if self.recorder is None or self.engine is None or not self.moves:
+            return
+        try:
+            self.recorder.write(self.engine.board, self.engine.move_cells, len(self.COLORS),
+                                self.game_state)
+        except OSError:
+            pass
+
+    def show_hint(self):
+        """Ищет подсказку в фоне и отмечает лучший найденный ход"""
+        if self.game_state == GameState.PLAYING and not self.autoplay:
+            self.start_search()
+
+    def toggle_autoplay(self):
+        """Включает или выключает автоигру"""
+        self.set_autoplay(not self.autoplay)
+        if self.autoplay and self.game_state == GameState.PLAYING:
+            self.start_search()
+
+    def set_autoplay(self, enabled):
+        if enabled == self.autoplay:
+            return
+        self.autoplay = enabled
+        self.autoplay_btn.config(text="⏸ Стоп" if enabled else "▶ Автоигра")
+        if not enabled:
+            self.stop_search()
+
+    def start_search(self):
+        """Запускает поиск хода из текущей позиции в фоновом потоке"""
+        engine = self.engine
+        self.search.start(engine.board, engine.crossed, engine.last)
+        self.search_started = time.perf_counter()
+        self.hint = None
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.SEARCH_POLL_MS, self.poll_search)
+
+    def stop_search(self):
+        """Отменяет фоновый поиск и убирает отметку подсказки"""
+        self.search.cancel()
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self.hint = None
+        self.hide_hint()
+
+    def poll_search(self):
+        """Забирает результаты поиска из очереди, не блокируя интерфейс"""
+        self._poll_id = None
+        running = self.search.running
+        hint = self.search.poll()
+        if hint is not None:
+            self.hint = hint
+
+        budget = self.AUTOPLAY_MOVE_TIME if self.autoplay else self.HINT_TIME
+        timed_out = time.perf_counter() - self.search_started >= budget
+        done = not running or timed_out or (self.hint is not None and self.hint.final)
+        if not done:
+            if self.hint is not None and not self.autoplay:
+                self.mark_hint(self.hint.move)
+            self._poll_id = self.root.after(self.SEARCH_POLL_MS, self.poll_search)
+            return
+
+        self.search.cancel()
+        if self.hint is None:
+            return
+        if self.autoplay:
+            self.cross_shape(self.hint.move)
+        else:
+            self.mark_hint(self.hint.move)
+
+    def mark_hint(self, cell):
+        """Обводит клетку подсказки"""
+        x, y = self.hit_tester.center(cell)
+        r = self.CELL_SIZE // 3 + 12
+        if self.hint_id is None:
+            self.hint_id = self.canvas.create_oval(
+                x - r, y - r, x + r, y + r,
+                outline="#43A047", width=3, dash=(6, 3), tags="hint"
+            )
+        else:
+            self.canvas.coords(self.hint_id, x - r, y - r, x + r, y + r)
+            self.canvas.itemconfigure(self.hint_id, state=tk.NORMAL)
+            # Фигуры, созданные после масштабирования или при прокрутке, лежат выше
+            self.canvas.tag_raise(self.hint_id)
+
+    def hide_hint(self):
+        if self.hint_id is not None:
+            self.canvas.itemconfigure(self.hint_id, state=tk.HIDDEN)
+
+    def update_info_panel(self):
+        """Обновляет информационную панель"""
+        self.moves_label.config(text=str(self.moves))
+        self.crossed_label.config(text=f"{self.crossed_figures}/{self.total_figures}")
+
+    def show_game_over(self, title, message):
+        """Показывает сообщение об окончании игры после текущего обработчика
+
+        Окно модальное: открытое прямо в обработчике хода, оно попало бы в
+        замеры его времени.
+        """
+        self.root.after_idle(self.ask_new_game, title, message)
+
+    def ask_new_game(self, title, message):
+        """Окно с итогом партии; при согласии начинается новая"""
+        result = messagebox.askyesno(title, f"{message}\n\nХотите сыграть еще раз?")
+        if result:
+            self.reset_game()
+
+    def on_canvas_click(self, event):
+        """Обработчик клика мыши по холсту"""
+        if self.game_state != GameState.PLAYING:
+            return
+
+        started = time.perf_counter() if self.instruments is not None else None
+        session = self.session
+
+        # Переводим координаты окна в координаты холста (с учетом прокрутки)
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+
+        cell = self.hit_tester.hit(x, y, self.engine.board.shapes)
+        if cell is None or not self.cross_shape(cell):
+            return
+
+        # Задержка до кадра. Холст ставит перерисовку в очередь ожидания, когда
+        # ход меняет элементы, а обработчики ожидания выполняются по порядку,
+        # поэтому этот запустится после перерисовки. Ход, завершивший партию,
+        # не замеряется, даже если новая партия уже началась.
+        if (started is not None and self._click_started is None
+                and self.session is session and self.game_state == GameState.PLAYING):
+            self._click_started = started
+            self.root.after_idle(self.on_painted)
+
+    def on_painted(self):
+        """Клик отрисован: записывает задержку от клика до кадра"""
+        self.instruments.add("click_to_paint", (time.perf_counter() - self._click_started) * 1000)
+        self._click_started = None
+        self.update_debug_overlay()
+
+    def profile_counters(self):
+        """Счетчики элементов холста для дампа замеров"""
+        stats = self.render_stats
+        return {
+            "grid_size": self.GRID_SIZE,
+            "canvas_items": len(self.canvas.find_all()),
+            "shape_items": {
+                "live": stats.live_items,
+                "created": stats.created,
+                "deleted": stats.deleted,
+                "configured": stats.configured,
+                "frames": stats.frames,
+            },
+        }
+
+    def update_debug_overlay(self):
+        """Обновляет отладочную панель замеров"""
+        timing = self.instruments.summary
+        click = timing("click_to_paint")
+        render = timing("render")
+        stats = self.render_stats
+        self.debug_label.config(text=(
+            f"клик→кадр p50/p95/p99: {click['p50']:.1f}/{click['p95']:.1f}/{click['p99']:.1f} мс"
+            f" ({click['count']})\n"
+            f"кадр p95: {render['p95']:.2f} мс · ход p95: {timing('cross_shape')['p95']:.2f} мс"
+            f" · новое поле p95: {timing('reset_game')['p95']:.1f} мс\n"
+            f"элементов холста: {len(self.canvas.find_all())}"
+            f" (фигур {stats.live_items}: создано {stats.created}, удалено {stats.deleted})"
+        ))
+
+    def dump_profile(self):
+        """Записывает замеры в JSON (F12 и при закрытии окна)"""
+        if self.instruments is None or self.profile_path is None:
+            return
+        try:
+            self.instruments.dump(self.profile_path, **self.profile_counters())
+        except OSError:
+            pass
+
+    def on_close(self):
+        """Закрытие окна: незаконченная партия и замеры сохраняются"""
+        self.record_game()
+        self.dump_profile()
+        self.root.destroy()
+
+    def on_xview(self, *args):
+        """Горизонтальная прокрутка полосой прокрутки"""
+        self.canvas.xview(*args)
+        self.update_viewport()
+
+    def on_yview(self, *args):
+        """Вертикальная прокрутка полосой прокрутки"""
+        self.canvas.yview(*args)
+        self.update_viewport()
+
+    def on_mouse_wheel(self, event):
+        """Прокрутка колесом мыши (с Shift - по горизонтали)"""
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        if event.state & 0x1:
+            self.canvas.xview_scroll(step, "units")
+        else:
+            self.canvas.yview_scroll(step, "units")
+        self.update_viewport()
+
+    def on_zoom(self, event):
+        """Масштабирование колесом мыши с Ctrl"""
+        factor = 1.25 if event.num == 4 or event.delta > 0 else 0.8
+        self.set_cell_size(int(self.CELL_SIZE * factor))
+
+    def run(self):
+        """Запускает главный цикл игры"""
+        self.root.mainloop()
+
+
+def launch(grid_size=4, cell_size=100, profile_path=None, debug=False, use_sprites=True):
+    """Создает окно и запускает главный цикл Tk
+
+    debug или profile_path включают замеры и отладочную панель; замеры
+    пишутся в profile_path по F12 и при закрытии окна. use_sprites=False -
+    векторные фигуры вместо готовых картинок.
+    """
+    root = tk.Tk()
+    root.resizable(False, False)
+    root.configure(bg="#F5F7FA")
+
+    # Размер окна под окно просмотра поля (для поля 4x4 - 520x760)
+    view_size = min(grid_size * cell_size + 50, 640)
+    width = view_size + 70
+    height = view_size + 310
+    root.geometry(f"{width}x{height}")
+
+    # Центрируем окно на экране
+    root.update_idletasks()
+    x = (root.winfo_screenwidth() // 2) - (width // 2)
+    y = (root.winfo_screenheight() // 2) - (height // 2)
+    root.geometry(f'{width}x{height}+{x}+{y}')
+
+    instruments = Instrumentation() if debug or profile_path else None
+    game = Game(root, grid_size, cell_size, instruments=instruments, profile_path=profile_path,
+                use_sprites=use_sprites)
+    game.run()
+
@@ -0,0 +1,60 @@
+"""Пакетная игра без дисплея
+
+Партии играются прямо на движке (Engine), без холста и tkinter: поля
+берутся у генератора с заданным зерном, ходы выбирает стратегия (см.
+strategies.py). Результат - сводная статистика по всем партиям.
+"""
+import random
+import time
+
+from engine import Engine, GameState, iter_cells
+from generator import BoardGenerator
+from strategies import Position, make_strategy
+
+
+def play_game(board, strategy):
+    """Играет одну партию до конца; возвращает (движок, время на выбор ходов в секундах)"""
+    engine = Engine(board)
+    strategy.reset(board)
+    thinking = 0.0
+    clock = time.perf_counter
+    while True:
+        moves = list(iter_cells(engine.legal_moves()))
+        if not moves:
+            return engine, thinking
+        started = clock()
+        cell = strategy.choose(Position.of(engine), moves)
+        thinking += clock() - started
+        engine.apply(cell)
+
+
+def play_games(games, grid_size=4, n_colors=7, strategy="random", seed=None):
+    """Играет games партий на новых полях; возвращает словарь со сводкой"""
+    player = make_strategy(strategy, random.Random(seed))
+    generator = BoardGenerator(grid_size, n_colors, seed=seed)
+
+    wins = total_moves = total_crossed = 0
+    thinking = 0.0
+    started = time.perf_counter()
+    for _ in range(games):
+        engine, elapsed = play_game(generator.generate(), player)
+        wins += engine.state() == GameState.WIN
+        total_moves += engine.moves
+        total_crossed += engine.crossed_count
+        thinking += elapsed
+    elapsed = time.perf_counter() - started
+
+    cells = grid_size * grid_size
+    return {
+        "games": games,
+        "grid_size": grid_size,
+        "strategy": strategy,
+        "seed": seed,
+        "wins": wins,
+        "win_rate": wins / games if games else 0.0,
+        "average_moves": total_moves / games if games else 0.0,
+        "average_crossed": total_crossed / games / cells if games else 0.0,
+        "move_time": thinking / total_moves if total_moves else 0.0,
+        "elapsed": elapsed,
+        "games_per_second": games / elapsed if elapsed else 0.0,
+    }
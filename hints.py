@@ -0,0 +1,158 @@
+"""Подсказки и автоигра: поиск с итеративным углублением в фоновом потоке
+
+Поиск «в любой момент» (anytime): после каждой глубины наружу отдается
+лучший найденный ход, так что прервать поиск можно когда угодно.
+Результаты передаются в поток интерфейса через очередь, которую интерфейс
+опрашивает сам (root.after), поэтому главный цикл Tk не блокируется.
+"""
+import queue
+import threading
+
+from engine import iter_cells
+
+# Как часто (в узлах) поиск проверяет флаг отмены
+CANCEL_CHECK_NODES = 512
+
+# Предельная глубина поиска (рекурсия Python ограничена)
+MAX_DEPTH = 500
+
+
+class SearchCancelled(Exception):
+    """Поиск отменен извне"""
+
+
+class Hint:
+    """Лучший ход, найденный на очередной глубине поиска"""
+
+    __slots__ = ("move", "depth", "score", "winning", "final")
+
+    def __init__(self, move, depth, score, winning, final):
+        self.move = move        # клетка, которую стоит зачеркнуть
+        self.depth = depth      # глубина завершенной итерации
+        self.score = score      # сколько клеток удается зачеркнуть подряд
+        self.winning = winning  # ход гарантированно ведет к победе
+        self.final = final      # поиск завершен, глубже искать нечего
+
+    def __repr__(self):
+        return (f"Hint(move={self.move}, depth={self.depth}, score={self.score}, "
+                f"winning={self.winning}, final={self.final})")
+
+
+class HintSearch:
+    """Поиск лучшего хода из позиции (crossed, last) на поле board
+
+    На глубине d каждый ход оценивается длиной самой длинной цепочки
+    зачеркиваний (не длиннее d), которую можно из него продолжить.
+    """
+
+    def __init__(self, board, crossed, last, cancel=None):
+        self.board = board
+        self.crossed = crossed
+        self.last = last
+        self.cancel = cancel
+        self.nodes = 0
+
+    def reach(self, crossed, last, depth, memo):
+        """Максимум ходов (не больше depth), которые можно сделать из позиции"""
+        self.nodes += 1
+        if self.cancel is not None and not self.nodes % CANCEL_CHECK_NODES and self.cancel.is_set():
+            raise SearchCancelled
+
+        moves = self.board.compat[last] & ~crossed
+        if not depth or not moves:
+            return 0
+        key = (crossed, last)
+        known = memo.get(key)
+        if known is not None:
+            return known
+
+        best = 0
+        for cell in iter_cells(moves):
+            best = max(best, 1 + self.reach(crossed | 1 << cell, cell, depth - 1, memo))
+            if best == depth:
+                break
+        memo[key] = best
+        return best
+
+    def run(self, report):
+        """Итеративное углубление; report(hint) вызывается после каждой глубины"""
+        board = self.board
+        compat = board.compat
+        remaining = board.full & ~self.crossed
+        moves = list(iter_cells(compat[self.last] & ~self.crossed))
+        if not moves:
+            return None
+
+        # При равных оценках предпочитаем клетки с меньшим числом продолжений
+        moves.sort(key=lambda cell: (compat[cell] & remaining).bit_count())
+        goal = remaining.bit_count()
+
+        hint = None
+        for depth in range(1, min(goal, MAX_DEPTH) + 1):
+            memo = {}
+            best_move, best_score = moves[0], -1
+            for cell in moves:
+                score = 1 + self.reach(self.crossed | 1 << cell, cell, depth - 1, memo)
+                if score > best_score:
+                    best_move, best_score = cell, score
+                    if score == depth:
+                        break
+
+            winning = best_score == goal
+            final = winning or best_score < depth or depth == goal
+            hint = Hint(best_move, depth, best_score, winning, final)
+            report(hint)
+            if final:
+                break
+        return hint
+
+
+class SearchWorker:
+    """Фоновый поток поиска подсказки, результаты - через очередь
+
+    Каждому запуску присваивается номер поколения; результаты отмененных
+    запусков отбрасываются при опросе.
+    """
+
+    def __init__(self):
+        self.results = queue.Queue()
+        self.generation = 0
+        self._cancel = None
+        self._thread = None
+
+    def start(self, board, crossed, last):
+        """Запускает поиск для позиции, отменяя предыдущий"""
+        self.cancel()
+        self.generation += 1
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        args=(self.generation, self._cancel, board, crossed, last))
+        self._thread.start()
+
+    def _run(self, generation, cancel, board, crossed, last):
+        search = HintSearch(board, crossed, last, cancel)
+        try:
+            search.run(lambda hint: self.results.put((generation, hint)))
+        except SearchCancelled:
+            pass
+
+    def cancel(self):
+        """Просит текущий поиск остановиться; не ждет завершения потока"""
+        if self._cancel is not None:
+            self._cancel.set()
+            self._cancel = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll(self):
+        """Последняя подсказка текущего поиска из очереди или None (не блокирует)"""
+        latest = None
+        while True:
+            try:
+                generation, hint = self.results.get_nowait()
+            except queue.Empty:
+                return latest
+            if generation == self.generation:
+                latest = hint
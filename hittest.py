@@ -0,0 +1,57 @@
+"""Попадание клика в фигуру за O(1)
+
+Клетка находится целочисленным делением координат, после чего точка
+проверяется только против фигуры этой клетки (для круга - по квадрату
+расстояния, без извлечения корня).
+"""
+from engine import CIRCLE
+
+
+class HitTester:
+    """Геометрия поля: size x size клеток по cell_size пикселей с отступом margin
+
+    scale - масштаб холста: координаты клика делятся на него перед проверкой.
+    """
+
+    def __init__(self, size, cell_size, margin=0, scale=1.0):
+        self.size = size
+        self.cell_size = cell_size
+        self.margin = margin
+        self.scale = scale
+        self.radius = cell_size // 3
+
+    def cell_at(self, x, y):
+        """Индекс клетки под точкой (x, y) холста или None вне поля"""
+        x = x / self.scale - self.margin
+        y = y / self.scale - self.margin
+        col = int(x // self.cell_size)
+        row = int(y // self.cell_size)
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return row * self.size + col
+        return None
+
+    def center(self, cell):
+        """Центр фигуры клетки в координатах поля без масштаба"""
+        row, col = divmod(cell, self.size)
+        half = self.cell_size // 2
+        return (col * self.cell_size + half + self.margin,
+                row * self.cell_size + half + self.margin)
+
+    def hit(self, x, y, shapes):
+        """Индекс клетки, в фигуру которой попала точка, или None
+
+        shapes - биты форм клеток (Board.shapes).
+        """
+        cell = self.cell_at(x, y)
+        if cell is None:
+            return None
+
+        cx, cy = self.center(cell)
+        dx = x / self.scale - cx
+        dy = y / self.scale - cy
+        radius = self.radius
+        if shapes[cell] == CIRCLE:
+            inside = dx * dx + dy * dy <= radius * radius
+        else:  # квадрат
+            inside = -radius <= dx <= radius and -radius <= dy <= radius
+        return cell if inside else None
@@ -0,0 +1,87 @@
+"""Замеры отзывчивости интерфейса: время обработчиков, кадров и задержка клика
+
+Выключенные замеры ничего не стоят: методы оборачиваются таймерами только
+при включении (instrument), а в горячих местах остается одна проверка
+на None. Последние замеры каждого вида хранятся в кольцевом буфере.
+"""
+import functools
+import json
+import math
+import time
+from collections import deque
+
+# Сколько последних замеров каждого вида хранится
+MAX_SAMPLES = 2000
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, q):
+    """q-й процентиль (ближайший ранг) отсортированной последовательности"""
+    if not values:
+        return 0.0
+    rank = max(0, math.ceil(q / 100 * len(values)) - 1)
+    return values[rank]
+
+
+class Instrumentation:
+    """Замеры длительностей по именам (в миллисекундах) и счетчики"""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self.samples = {}
+        self.counts = {}
+        self.started = time.perf_counter()
+
+    def add(self, name, ms):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.max_samples)
+            self.counts[name] = 0
+        samples.append(ms)
+        self.counts[name] += 1
+
+    def timed(self, name, func):
+        """func, обернутая замером времени под именем name"""
+        add = self.add
+        clock = time.perf_counter
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                add(name, (clock() - started) * 1000)
+        return wrapper
+
+    def instrument(self, obj, names, prefix=""):
+        """Подменяет методы names объекта obj замеряющими обертками"""
+        for name in names:
+            setattr(obj, name, self.timed(prefix + name, getattr(obj, name)))
+
+    def summary(self, name):
+        """Число замеров, среднее, максимум и процентили по имени"""
+        values = sorted(self.samples.get(name, ()))
+        result = {
+            "count": self.counts.get(name, 0),
+            "mean": sum(values) / len(values) if values else 0.0,
+            "max": values[-1] if values else 0.0,
+        }
+        for q in PERCENTILES:
+            result[f"p{q}"] = percentile(values, q)
+        return result
+
+    def snapshot(self, **extra):
+        """Все сводки одним словарем (для JSON)"""
+        data = {
+            "uptime": time.perf_counter() - self.started,
+            "timings_ms": {name: self.summary(name) for name in sorted(self.samples)},
+        }
+        data.update(extra)
+        return data
+
+    def dump(self, path, **extra):
+        """Записывает snapshot() в файл JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(**extra), f, indent=2, ensure_ascii=False)
@@ -0,0 +1,62 @@
+"""Цветовая палитра игры
+
+Производные цвета (светлая заливка, контур, свечение) вычисляются один раз
+при создании палитры; модель и фигуры хранят только индекс цвета.
+Заливки произвольных цветов (в том числе цветов пользовательских палитр)
+кешируются в ограниченном LRU-кеше fill_color.
+"""
+from functools import lru_cache
+
+# Светлая цветовая палитра
+DEFAULT_COLORS = (
+    "#42A5F5",  # Светло-синий
+    "#EF5350",  # Светло-красный
+    "#66BB6A",  # Светло-зеленый
+    "#FFA726",  # Светло-оранжевый
+    "#AB47BC",  # Светло-фиолетовый
+    "#26C6DA",  # Бирюзовый
+    "#FFCA28",  # Желтый
+)
+
+FILL_AMOUNT = 0.7
+GLOW_COLOR = "#FFF9C4"
+
+
+def lighten(color_hex, amount=FILL_AMOUNT):
+    """Осветляет цвет"""
+    if color_hex.startswith('#'):
+        color_hex = color_hex[1:]
+    r = int(color_hex[0:2], 16)
+    g = int(color_hex[2:4], 16)
+    b = int(color_hex[4:6], 16)
+
+    light_r = min(255, int(r + (255 - r) * amount))
+    light_g = min(255, int(g + (255 - g) * amount))
+    light_b = min(255, int(b + (255 - b) * amount))
+
+    return f'#{light_r:02x}{light_g:02x}{light_b:02x}'
+
+
+@lru_cache(maxsize=256)
+def fill_color(color_hex):
+    """Светлая заливка для произвольного цвета (с кешем)"""
+    return lighten(color_hex)
+
+
+class Palette:
+    """Набор цветов с заранее вычисленными заливкой, контуром и свечением"""
+
+    def __init__(self, colors=DEFAULT_COLORS, glow=GLOW_COLOR):
+        self.colors = tuple(colors)
+        self.outlines = self.colors
+        self.fills = tuple(fill_color(color) for color in self.colors)
+        self.glows = (glow,) * len(self.colors)
+
+    def __len__(self):
+        return len(self.colors)
+
+    def __getitem__(self, index):
+        return self.colors[index]
+
+
+DEFAULT_PALETTE = Palette()
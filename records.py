@@ -0,0 +1,202 @@
+"""Компактные двоичные записи партий
+
+Журнал - файл с заголовком и записями фиксированной ширины для одного
+размера поля. Запись не зависит от фигур и холста: раскладка поля
+(полбайта на клетку, см. Board.encode), начальная клетка, итог и список
+зачеркнутых клеток. Читатель отображает журнал в память (mmap) и отдает
+записи как представления memoryview без копирования.
+
+Формат (little-endian):
+    заголовок файла: b"XFGR", версия (B), размер поля (B), 2 байта резерва
+    запись: число цветов (B), итог (B), начальная клетка (H), число ходов (H),
+            раскладка ((cells + 1) // 2 байт), ходы (cells - 1 штук по H,
+            неиспользованные заполнены NO_MOVE)
+"""
+import mmap
+import os
+import struct
+import sys
+from collections import Counter
+
+from engine import Board, Engine, GameState
+
+MAGIC = b"XFGR"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sBBxx")
+RECORD_HEADER = struct.Struct("<BBHH")
+NO_MOVE = 0xFFFF
+
+# Итог партии в записи
+RESULTS = {None: 0, GameState.PLAYING: 0, GameState.WIN: 1, GameState.LOSE: 2}
+STATES = {0: GameState.PLAYING, 1: GameState.WIN, 2: GameState.LOSE}
+
+
+def record_size(size):
+    """Ширина одной записи в байтах для поля size x size"""
+    cells = size * size
+    return RECORD_HEADER.size + (cells + 1) // 2 + 2 * (cells - 1)
+
+
+def log_path(directory, size):
+    """Файл журнала для полей данного размера"""
+    return os.path.join(directory, f"games_{size}x{size}.bin")
+
+
+class GameRecorder:
+    """Дописывает записи партий в конец журнала"""
+
+    def __init__(self, path, size):
+        self.path = path
+        self.size = size
+        self.width = record_size(size)
+        if not os.path.exists(path) or not os.path.getsize(path):
+            with open(path, "wb") as f:
+                f.write(FILE_HEADER.pack(MAGIC, VERSION, size))
+        else:
+            with open(path, "rb") as f:
+                magic, version, file_size = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+            if magic != MAGIC or version != VERSION or file_size != size:
+                raise ValueError(f"{path}: журнал другого формата или размера поля")
+
+    def pack(self, board, moves, n_colors, result=None):
+        cells = board.cells
+        if len(moves) > cells - 1:
+            raise ValueError("Ходов больше, чем клеток на поле")
+        padded = list(moves) + [NO_MOVE] * (cells - 1 - len(moves))
+        return (RECORD_HEADER.pack(n_colors, RESULTS[result], board.start, len(moves))
+                + board.encode()
+                + struct.pack(f"<{cells - 1}H", *padded))
+
+    def write(self, board, moves, n_colors, result=None):
+        """Записывает партию: поле, зачеркнутые по порядку клетки и итог"""
+        if board.size != self.size:
+            raise ValueError("Размер поля не совпадает с журналом")
+        with open(self.path, "ab") as f:
+            f.write(self.pack(board, moves, n_colors, result))
+
+
+class GameRecord:
+    """Представление одной записи журнала без копирования данных"""
+
+    __slots__ = ("size", "view")
+
+    def __init__(self, size, view):
+        self.size = size
+        self.view = view
+
+    @property
+    def n_colors(self):
+        return self.view[0]
+
+    @property
+    def result(self):
+        return STATES[self.view[1]]
+
+    @property
+    def start(self):
+        return self.view[2] | self.view[3] << 8
+
+    @property
+    def n_moves(self):
+        return self.view[4] | self.view[5] << 8
+
+    @property
+    def layout(self):
+        offset = RECORD_HEADER.size
+        return self.view[offset:offset + (self.size * self.size + 1) // 2]
+
+    @property
+    def moves(self):
+        """Зачеркнутые клетки по порядку (memoryview формата H)"""
+        offset = RECORD_HEADER.size + (self.size * self.size + 1) // 2
+        moves = self.view[offset:offset + 2 * self.n_moves]
+        if sys.byteorder == "little":
+            return moves.cast("H")
+        return struct.unpack(f"<{self.n_moves}H", moves)
+
+    def board(self):
+        return Board.decode(self.size, self.layout, self.start)
+
+    def replay(self):
+        """Проигрывает партию через движок; ValueError, если запись не по правилам"""
+        engine = Engine(self.board())
+        for cell in self.moves:
+            engine.apply(cell)
+        state = engine.state()
+        # Проигрыш может быть объявлен досрочно (см. deadend.py), пока ходы еще есть
+        if self.result != GameState.PLAYING and (state == GameState.WIN) != (self.result == GameState.WIN):
+            raise ValueError(f"Итог в записи {self.result} не совпадает с {state}")
+        return engine
+
+
+class GameLog:
+    """Журнал партий, отображенный в память"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.size = FILE_HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: не журнал партий")
+        self.width = record_size(self.size)
+        self._view = memoryview(self._map)[FILE_HEADER.size:]
+
+    def close(self):
+        """Закрывает журнал; если живы записи-представления, отображение
+        освободится вместе с последней из них"""
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._view) // self.width
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        offset = index * self.width
+        return GameRecord(self.size, self._view[offset:offset + self.width])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def stats(self):
+        """Сводка по журналу: число партий, доля побед, средняя длина и места застревания"""
+        games = wins = finished = total_moves = 0
+        stuck = Counter()
+        view = self._view
+        width = self.width
+        for offset in range(0, len(self) * width, width):
+            result = view[offset + 1]
+            n_moves = view[offset + 4] | view[offset + 5] << 8
+            games += 1
+            total_moves += n_moves
+            if result:
+                finished += 1
+            if result == 1:
+                wins += 1
+            elif result == 2:
+                # Клетка, на которой игрок остался без ходов
+                record = GameRecord(self.size, view[offset:offset + width])
+                stuck[record.moves[-1] if n_moves else record.start] += 1
+        return {
+            "games": games,
+            "wins": wins,
+            "win_rate": wins / finished if finished else 0.0,
+            "average_moves": total_moves / games if games else 0.0,
+            "stuck_cells": stuck,
+        }
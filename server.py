@@ -0,0 +1,325 @@
+"""Сервер партий: много сессий в одном процессе, строки JSON по TCP
+
+Каждая партия - сессия session.Session (движок и проверка раннего
+проигрыша, без холста), поэтому правила те же, что в окне. Одна строка
+JSON - один запрос, на каждый запрос - одна строка ответа в том же
+порядке:
+
+    {"id": 1, "op": "new", "size": 4}
+    {"id": 2, "op": "move", "session": 1, "cell": 5}
+    {"id": 3, "op": "hint", "session": 1}
+    {"id": 4, "op": "undo", "session": 1}
+
+Операции: new, move, hint, undo, redo, state, close. Ответ - {"id": ...,
+"ok": true, ...} с позицией сессии или {"id": ..., "ok": false,
+"error": "..."}. Генерация поля, поиск подсказки, ограниченный по
+времени, и ходы на больших полях выполняются в пулах потоков, поэтому
+долгий запрос одной партии не задерживает остальные. Пока такой запрос
+выполняется, другие запросы к той же сессии получают ошибку.
+
+    python server.py --port 8765
+"""
+import argparse
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from engine import GameState, iter_cells
+from generator import BoardGenerator
+from hints import HintSearch, SearchCancelled
+from palette import DEFAULT_PALETTE
+from session import Session
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+MIN_SIZE = 3
+MAX_SIZE = 20
+
+# Самые давние сессии вытесняются, когда их больше этого числа
+MAX_SESSIONS = 10000
+
+# Время на поиск подсказки, секунд, и число потоков поиска
+HINT_TIME = 0.2
+HINT_WORKERS = 4
+
+# Ходы на полях больше этого числа клеток выполняются в пуле потоков:
+# на малых полях проверка быстрее передачи хода в другой поток
+INLINE_MAX_CELLS = 16
+MOVE_WORKERS = 4
+
+# Предельная длина строки запроса, байт
+MAX_LINE = 64 * 1024
+
+
+class RequestError(Exception):
+    """Ошибка в запросе клиента: отправляется в ответе, соединение не рвется"""
+
+
+def is_int(value):
+    """Целое число JSON: true и false в Python тоже int, но не подходят"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def find_hint(board, crossed, last, cancel):
+    """Лучшая подсказка, найденная до отмены (выполняется в потоке пула)"""
+    hints = []
+    try:
+        HintSearch(board, crossed, last, cancel).run(hints.append)
+    except SearchCancelled:
+        pass
+    return hints[-1] if hints else None
+
+
+class GameServer:
+    """Сессии партий и обработка запросов; сеть - в serve() и handle()"""
+
+    def __init__(self, n_colors=None, seed=None, max_sessions=MAX_SESSIONS,
+                 hint_time=HINT_TIME, hint_workers=HINT_WORKERS, move_workers=MOVE_WORKERS):
+        self.n_colors = n_colors if n_colors is not None else len(DEFAULT_PALETTE)
+        self.seed = seed
+        self.max_sessions = max_sessions
+        self.hint_time = hint_time
+        self.hint_executor = ThreadPoolExecutor(hint_workers, thread_name_prefix="hint")
+        self.move_executor = ThreadPoolExecutor(move_workers, thread_name_prefix="move")
+        # Генераторы полей не потокобезопасны: все поля генерирует один поток
+        self.new_executor = ThreadPoolExecutor(1, thread_name_prefix="new")
+        self.sessions = OrderedDict()
+        self.busy = set()
+        self.generators = {}
+        self.next_id = 1
+        self.requests = 0
+        self.evicted = 0
+
+        self.operations = {
+            "new": self.op_new,
+            "move": self.op_move,
+            "hint": self.op_hint,
+            "undo": self.op_undo,
+            "redo": self.op_redo,
+            "state": self.op_state,
+            "close": self.op_close,
+        }
+
+    def close(self):
+        self.hint_executor.shutdown(wait=False, cancel_futures=True)
+        self.move_executor.shutdown(wait=False, cancel_futures=True)
+        self.new_executor.shutdown(wait=False, cancel_futures=True)
+
+    def generator(self, size):
+        generator = self.generators.get(size)
+        if generator is None:
+            seed = None if self.seed is None else f"{self.seed}:{size}"
+            generator = self.generators[size] = BoardGenerator(size, self.n_colors, seed=seed)
+        return generator
+
+    def session(self, request):
+        """Сессия запроса; недавно использованные сессии вытесняются последними"""
+        session_id = request.get("session")
+        if not is_int(session_id):
+            raise RequestError("Номер сессии должен быть целым числом")
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise RequestError(f"Нет сессии {session_id}")
+        if session_id in self.busy:
+            raise RequestError(f"Сессия {session_id} занята предыдущим запросом")
+        self.sessions.move_to_end(session_id)
+        return session_id, session
+
+    async def run(self, session_id, executor, func, *args):
+        """func(*args) в потоке пула; на это время сессия занята"""
+        self.busy.add(session_id)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        finally:
+            self.busy.discard(session_id)
+
+    async def change(self, session_id, session, func, *args):
+        """Ход или повтор хода: на больших полях - в пуле потоков"""
+        if session.board.cells <= INLINE_MAX_CELLS:
+            return func(*args)
+        return await self.run(session_id, self.move_executor, func, *args)
+
+    @staticmethod
+    def position(session_id, session):
+        """Позиция сессии для ответа"""
+        engine = session.engine
+        dead_end = session.dead_end
+        playing = session.state == GameState.PLAYING
+        return {
+            "session": session_id,
+            "state": session.state.value,
+            "last": engine.last,
+            "moves": engine.moves,
+            "crossed": engine.crossed_count,
+            "legal": list(iter_cells(engine.legal_moves())) if playing else [],
+            "dead_end": dead_end.reason if dead_end is not None else None,
+        }
+
+    async def dispatch(self, request):
+        """Ответ (словарь) на один разобранный запрос"""
+        self.requests += 1
+        if not isinstance(request, dict):
+            raise RequestError("Запрос должен быть объектом JSON")
+        op = request.get("op")
+        operation = self.operations.get(op) if isinstance(op, str) else None
+        if operation is None:
+            raise RequestError(f"Неизвестная операция: {request.get('op')}")
+        return await operation(request)
+
+    async def op_new(self, request):
+        size = request.get("size", 4)
+        if not is_int(size) or not MIN_SIZE <= size <= MAX_SIZE:
+            raise RequestError(f"Размер поля должен быть от {MIN_SIZE} до {MAX_SIZE}")
+        board = await asyncio.get_running_loop().run_in_executor(
+            self.new_executor, self.generator(size).generate)
+
+        session_id = self.next_id
+        self.next_id += 1
+        session = self.sessions[session_id] = Session(board)
+        while len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+            self.evicted += 1
+
+        response = self.position(session_id, session)
+        response["board"] = {
+            "size": board.size,
+            "colors": board.colors,
+            "shapes": board.shapes,
+            "start": board.start,
+        }
+        return response
+
+    async def op_move(self, request):
+        session_id, session = self.session(request)
+        cell = request.get("cell")
+        if not is_int(cell) or not 0 <= cell < session.board.cells:
+            raise RequestError("Клетка вне поля")
+        try:
+            await self.change(session_id, session, session.cross, cell)
+        except ValueError as error:
+            raise RequestError(str(error)) from None
+        return self.position(session_id, session)
+
+    async def op_hint(self, request):
+        session_id, session = self.session(request)
+        engine = session.engine
+        hint = None
+        if session.state == GameState.PLAYING:
+            cancel = threading.Event()
+            timer = asyncio.get_running_loop().call_later(self.hint_time, cancel.set)
+            try:
+                hint = await self.run(session_id, self.hint_executor, find_hint, engine.board,
+                                      engine.crossed, engine.last, cancel)
+            finally:
+                timer.cancel()
+
+        response = self.position(session_id, session)
+        response["hint"] = None if hint is None else {
+            "move": hint.move,
+            "depth": hint.depth,
+            "score": hint.score,
+            "winning": hint.winning,
+        }
+        return response
+
+    async def op_undo(self, request):
+        session_id, session = self.session(request)
+        if session.undo() is None:
+            raise RequestError("Нечего отменять")
+        return self.position(session_id, session)
+
+    async def op_redo(self, request):
+        session_id, session = self.session(request)
+        if await self.change(session_id, session, session.redo) is None:
+            raise RequestError("Нечего повторять")
+        return self.position(session_id, session)
+
+    async def op_state(self, request):
+        return self.position(*self.session(request))
+
+    async def op_close(self, request):
+        session_id, _ = self.session(request)
+        del self.sessions[session_id]
+        return {"session": session_id}
+
+    async def respond(self, line):
+        """Строка ответа на строку запроса"""
+        request = None
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                raise RequestError("Запрос - не JSON") from None
+            response = await self.dispatch(request)
+            response["ok"] = True
+        except RequestError as error:
+            response = {"ok": False, "error": str(error)}
+        except Exception as error:
+            # Ошибка сервера на одном запросе не должна рвать соединение
+            response = {"ok": False, "error": f"Внутренняя ошибка: {type(error).__name__}"}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        return json.dumps(response, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    async def handle(self, reader, writer):
+        """Одно соединение: запросы обрабатываются по очереди"""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Строка длиннее MAX_LINE
+                    error = {"ok": False, "error": "Слишком длинный запрос"}
+                    writer.write(json.dumps(error, ensure_ascii=False).encode() + b"\n")
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                writer.write((await self.respond(line)).encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Запускает прием соединений; возвращает asyncio.Server"""
+        return await asyncio.start_server(self.handle, host, port, limit=MAX_LINE)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, **options):
+    server = GameServer(**options)
+    listener = await server.start(host, port)
+    address = listener.sockets[0].getsockname()
+    print(f"Сервер партий на {address[0]}:{address[1]}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сервер партий (строки JSON по TCP)")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="адрес")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="порт")
+    parser.add_argument("--colors", type=int, default=len(DEFAULT_PALETTE), help="число цветов")
+    parser.add_argument("--seed", type=int, default=None, help="зерно генератора полей")
+    parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS,
+                        help="сколько сессий хранить (давние вытесняются)")
+    parser.add_argument("--hint-time", type=float, default=HINT_TIME,
+                        help="время на поиск подсказки, секунд")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, n_colors=args.colors, seed=args.seed,
+                          max_sessions=args.max_sessions, hint_time=args.hint_time))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Партия по правилам игры без отрисовки
+
+Session - общее ядро окна (gui.Game) и сервера (server.py): ход по
+правилам движка, отмена и повтор, ранний проигрыш, когда выигрыш уже
+невозможен (deadend.py). Интерфейс только отображает состояние сессии,
+поэтому партия в окне и на сервере ведет себя одинаково.
+"""
+from deadend import DeadEndDetector
+from engine import Engine, GameState
+
+
+class Session:
+    """Партия на поле board: позиция, состояние и причина раннего проигрыша"""
+
+    __slots__ = ("engine", "dead_ends", "state", "dead_end")
+
+    def __init__(self, board):
+        self.engine = Engine(board)
+        self.dead_ends = DeadEndDetector(board)
+        self.state = GameState.PLAYING
+        self.dead_end = None
+
+    @property
+    def board(self):
+        return self.engine.board
+
+    def can_cross(self, cell):
+        """Можно ли зачеркнуть клетку: партия идет и ход по правилам"""
+        return self.state == GameState.PLAYING and self.engine.can_cross(cell)
+
+    def cross(self, cell):
+        """Зачеркивает клетку; ValueError, если партия окончена или ход не по правилам"""
+        if self.state != GameState.PLAYING:
+            raise ValueError("Партия окончена")
+        self.engine.apply(cell)
+        self._after_move()
+
+    def undo(self):
+        """Отменяет ход; возвращает (клетка, прежняя последняя клетка) или None"""
+        result = self.engine.undo()
+        if result is not None:
+            self.state = self.engine.state()
+            self.dead_ends.reset(self.engine.crossed, self.engine.last)
+            self.dead_end = None
+        return result
+
+    def redo(self):
+        """Повторяет отмененный ход; возвращает (клетка, прежняя последняя клетка) или None"""
+        result = self.engine.redo()
+        if result is not None:
+            self._after_move()
+        return result
+
+    def _after_move(self):
+        # Проигрыш объявляется сразу, как только выигрыш становится невозможен
+        self.dead_ends.cross(self.engine.last)
+        self.state = self.engine.state()
+        if self.state == GameState.PLAYING:
+            self.dead_end = self.dead_ends.check()
+            if self.dead_end is not None:
+                self.state = GameState.LOSE
@@ -0,0 +1,195 @@
+"""Точный решатель: можно ли зачеркнуть все фигуры из данной позиции
+
+Поиск в глубину по состояниям (маска зачеркнутых, последняя клетка) с
+таблицей транспозиций. Ходы перебираются по правилу Варнсдорфа (сначала
+клетки с наименьшим числом продолжений), а заведомо проигранные позиции
+отсекаются дешевыми необходимыми условиями.
+
+SolverCache хранит один решатель (и его таблицу транспозиций) на класс
+эквивалентных полей - см. symmetry.py.
+"""
+from collections import OrderedDict
+
+from engine import iter_cells
+from symmetry import canonicalize
+
+
+class SolverLimitExceeded(RuntimeError):
+    """Поиск превысил заданный лимит узлов"""
+
+
+class Solver:
+    """Решатель для одного расклада Board"""
+
+    def __init__(self, board, max_nodes=None):
+        self.board = board
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.compat = board.compat
+
+        # Таблицы транспозиций: проигранные позиции и число решений
+        self.lost = set()
+        self.counts = {}
+
+    def _state(self, crossed, last):
+        if crossed is None:
+            crossed = 1 << self.board.start
+        if last is None:
+            last = self.board.start
+        return crossed, last
+
+    def _visit(self):
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SolverLimitExceeded(f"Превышен лимит в {self.max_nodes} узлов")
+
+    def is_dead(self, crossed, last):
+        """Дешевая проверка: позиция заведомо не ведет к победе"""
+        compat = self.compat
+        remaining = self.board.full & ~crossed
+
+        # Все незачеркнутые клетки должны быть достижимы из последней
+        seen = 0
+        frontier = compat[last] & remaining
+        while frontier:
+            seen |= frontier
+            grown = 0
+            for cell in iter_cells(frontier):
+                grown |= compat[cell]
+            frontier = grown & remaining & ~seen
+        if seen != remaining:
+            return True
+
+        # Клетка, в которую можно войти только одним способом, уже не имеет
+        # продолжения и поэтому может быть только последней в пути
+        ends = 0
+        open_cells = remaining | 1 << last
+        for cell in iter_cells(remaining):
+            if (compat[cell] & open_cells).bit_count() < 2:
+                ends += 1
+                if ends > 1:
+                    return True
+        return False
+
+    def ordered_moves(self, crossed, last):
+        """Ходы из позиции, упорядоченные по правилу Варнсдорфа"""
+        compat = self.compat
+        moves = list(iter_cells(compat[last] & ~crossed))
+        if len(moves) > 1:
+            remaining = self.board.full & ~crossed
+            moves.sort(key=lambda cell: (compat[cell] & remaining).bit_count())
+        return moves
+
+    def solve(self, crossed=None, last=None):
+        """Один выигрышный путь (список клеток) или None, если победа невозможна"""
+        crossed, last = self._state(crossed, last)
+        full = self.board.full
+        if crossed == full:
+            return []
+        if (crossed, last) in self.lost:
+            return None
+
+        path = []
+        stack = [(crossed, last, iter(self.ordered_moves(crossed, last)))]
+        while stack:
+            crossed, last, moves = stack[-1]
+            for cell in moves:
+                child = crossed | 1 << cell
+                if child == full:
+                    path.append(cell)
+                    return path
+                if (child, cell) in self.lost:
+                    continue
+                self._visit()
+                if self.is_dead(child, cell):
+                    self.lost.add((child, cell))
+                    continue
+                path.append(cell)
+                stack.append((child, cell, iter(self.ordered_moves(child, cell))))
+                break
+            else:
+                stack.pop()
+                self.lost.add((crossed, last))
+                if path:
+                    path.pop()
+        return None
+
+    def is_winnable(self, crossed=None, last=None):
+        return self.solve(crossed, last) is not None
+
+    def count_solutions(self, crossed=None, last=None):
+        """Число различных выигрышных путей из позиции"""
+        crossed, last = self._state(crossed, last)
+        return self._count(crossed, last)
+
+    def _count(self, crossed, last):
+        if crossed == self.board.full:
+            return 1
+        key = (crossed, last)
+        total = self.counts.get(key)
+        if total is not None:
+            return total
+
+        self._visit()
+        total = 0
+        if key not in self.lost and not self.is_dead(crossed, last):
+            for cell in iter_cells(self.compat[last] & ~crossed):
+                total += self._count(crossed | 1 << cell, cell)
+        if not total:
+            self.lost.add(key)
+        self.counts[key] = total
+        return total
+
+
+class SolverCache:
+    """Решатели, общие для всех полей одного класса симметрии
+
+    Позиции переводятся в клетки канонического поля, поэтому проигранные
+    позиции и число решений, найденные для одного поля, сразу известны
+    для всех его поворотов, отражений и перекрасок.
+    """
+
+    def __init__(self, max_boards=256, max_nodes=None):
+        self.max_boards = max_boards
+        self.max_nodes = max_nodes
+        self.hits = 0
+        self.misses = 0
+        self._solvers = OrderedDict()
+
+    def __len__(self):
+        return len(self._solvers)
+
+    def solver(self, board):
+        """(решатель канонического поля, Canonical) для поля board"""
+        canonical = canonicalize(board)
+        solver = self._solvers.get(canonical.key)
+        if solver is None:
+            self.misses += 1
+            solver = Solver(canonical.board, self.max_nodes)
+            self._solvers[canonical.key] = solver
+            if len(self._solvers) > self.max_boards:
+                self._solvers.popitem(last=False)
+        else:
+            self.hits += 1
+            self._solvers.move_to_end(canonical.key)
+        # Лимит узлов действует на каждый вызов, а не на весь срок жизни решателя
+        solver.nodes = 0
+        return solver, canonical
+
+    def solve(self, board, crossed=None, last=None):
+        """Как Solver(board).solve(), но с общей таблицей для эквивалентных полей"""
+        solver, canonical = self.solver(board)
+        if crossed is None:
+            crossed = 1 << board.start
+        if last is None:
+            last = board.start
+        path = solver.solve(*canonical.state(crossed, last))
+        return None if path is None else canonical.path(path)
+
+    def is_winnable(self, board, crossed=None, last=None):
+        return self.solve(board, crossed, last) is not None
+
+    def count_solutions(self, board):
+        """Число выигрышных путей из начальной позиции (одинаково для эквивалентных полей)"""
+        solver, _ = self.solver(board)
+        return solver.count_solutions()
@@ -0,0 +1,161 @@
+"""Готовые картинки клеток для отрисовки одним элементом холста
+
+Вместо двух-семи векторных элементов на клетку (контур, заливка,
+свечение, крестики) клетка рисуется одним элементом-картинкой. Картинка
+для каждого сочетания (форма, цвет, состояние) растрируется один раз на
+размер клетки и хранится в кеше; смена состояния клетки - это только
+itemconfigure(image=...). При смене размера клетки кеш очищается и
+заполняется заново по мере надобности.
+
+Модуль не импортирует tkinter: картинки создает переданная фабрика
+(tk.PhotoImage в интерфейсе).
+"""
+import math
+
+from engine import ShapeType
+from palette import DEFAULT_PALETTE
+
+BACKGROUND = "#FAFAFA"
+CROSS_COLOR = "#FF7043"
+LAST_CROSS_COLOR = "#E53935"
+START_COLOR = "#FF7043"
+
+OUTLINE_WIDTH = 3
+GLOW_PADDING = 8
+START_DASH = (4, 2)
+
+
+def tile_size(cell_size):
+    """Сторона картинки: клетка без линий сетки по краям"""
+    return max(1, cell_size - 1)
+
+
+def _on_segment(dx, dy, sign, half_length, half_width):
+    """Точка в полосе ширины 2*half_width вдоль диагонали (sign=1 - "\\", -1 - "/")"""
+    along = (dx + sign * dy) / math.sqrt(2)
+    across = (dx - sign * dy) / math.sqrt(2)
+    limit = half_length * math.sqrt(2)
+    if abs(across) > half_width:
+        return None
+    if abs(along) <= limit:
+        return along
+    # Скругленные концы линии
+    end = math.copysign(limit, along)
+    if (along - end) ** 2 + across ** 2 <= half_width ** 2:
+        return end
+    return None
+
+
+def _paint_segment(rows, center, sign, half_length, half_width, color, dash=None):
+    """Рисует по строкам диагональную линию; проверяются только пиксели рядом с ней"""
+    size = len(rows)
+    reach = half_width * math.sqrt(2)
+    limit = half_length * math.sqrt(2)
+    for py in range(size):
+        dy = py - center
+        row = rows[py]
+        middle = sign * dy
+        for px in range(max(0, math.ceil(center + middle - reach)),
+                        min(size, math.floor(center + middle + reach) + 1)):
+            along = _on_segment(px - center, dy, sign, half_length, half_width)
+            if along is None:
+                continue
+            if dash is None or (along + limit) % sum(dash) < dash[0]:
+                row[px] = color
+
+
+def rasterize(cell_size, shape_type, fill, outline, glow=None, cross=None, start=False,
+              background=BACKGROUND):
+    """Строки пикселей (списки цветов "#rrggbb") картинки клетки
+
+    glow - цвет свечения или None; cross - None или (цвет, полудлина, ширина)
+    крестика зачеркнутой фигуры; start - пунктирный крестик начальной фигуры.
+    Геометрия повторяет векторную фигуру Shape.
+    """
+    size = tile_size(cell_size)
+    center = cell_size // 2 - 1
+    radius = cell_size // 3
+    circle = shape_type == ShapeType.CIRCLE
+    glow_radius_sq = (radius + GLOW_PADDING) ** 2
+    fill_limit = radius - OUTLINE_WIDTH
+    outline_low = radius - OUTLINE_WIDTH / 2
+    outline_high = radius + OUTLINE_WIDTH / 2
+
+    rows = []
+    for py in range(size):
+        dy = py - center
+        row = []
+        for px in range(size):
+            dx = px - center
+            color = background
+            if glow is not None and dx * dx + dy * dy <= glow_radius_sq:
+                color = glow
+            distance = math.hypot(dx, dy) if circle else max(abs(dx), abs(dy))
+            if distance <= fill_limit:
+                color = fill
+            elif outline_low <= distance <= outline_high:
+                color = outline
+            row.append(color)
+        rows.append(row)
+
+    if start:
+        for sign in (1, -1):
+            _paint_segment(rows, center, sign, cell_size // 4, 1.5, START_COLOR, START_DASH)
+    if cross is not None:
+        cross_color, half_length, width = cross
+        for sign in (1, -1):
+            _paint_segment(rows, center, sign, half_length, width / 2, cross_color)
+    return rows
+
+
+class SpriteCache:
+    """Картинки клеток по (форма, цвет, зачеркнута, последняя, начальная)"""
+
+    def __init__(self, cell_size, image_factory, palette=DEFAULT_PALETTE, background=BACKGROUND):
+        self.cell_size = cell_size
+        self.image_factory = image_factory
+        self.palette = palette
+        self.background = background
+        self.tiles = {}
+        self.rendered = 0
+
+    def __len__(self):
+        return len(self.tiles)
+
+    def set_cell_size(self, cell_size):
+        """Новый размер клетки: старые картинки отбрасываются, новые строятся по требованию"""
+        if cell_size != self.cell_size:
+            self.cell_size = cell_size
+            self.tiles.clear()
+
+    @staticmethod
+    def key(shape_type, color, crossed, is_last_crossed, is_starting):
+        """Ключ кеша: состояния, которые выглядят одинаково, совпадают"""
+        return (shape_type, color, crossed, crossed and is_last_crossed,
+                is_starting and not crossed)
+
+    def tile(self, shape_type, color, crossed=False, is_last_crossed=False, is_starting=False):
+        """Картинка клетки (строится при первом обращении)"""
+        key = self.key(shape_type, color, crossed, is_last_crossed, is_starting)
+        image = self.tiles.get(key)
+        if image is None:
+            image = self.tiles[key] = self._render(*key)
+        return image
+
+    def _render(self, shape_type, color, crossed, glow, start):
+        palette = self.palette
+        cell_size = self.cell_size
+        cross = None
+        if crossed:
+            if glow:
+                cross = (LAST_CROSS_COLOR, cell_size // 2.2, 5)
+            else:
+                cross = (CROSS_COLOR, cell_size // 3.2, 3)
+        rows = rasterize(cell_size, shape_type, palette.fills[color], palette.outlines[color],
+                         palette.glows[color] if glow else None, cross, start, self.background)
+
+        size = tile_size(cell_size)
+        image = self.image_factory(width=size, height=size)
+        image.put(" ".join("{" + " ".join(row) + "}" for row in rows), to=(0, 0))
+        self.rendered += 1
+        return image
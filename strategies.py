@@ -0,0 +1,180 @@
+"""Стратегии игрока: подключаемый интерфейс выбора хода
+
+Стратегия получает позицию только для чтения (Position) и список
+допустимых ходов и возвращает клетку, которую зачеркнуть. Свои стратегии
+подключаются через register():
+
+    class Corner(Strategy):
+        def choose(self, position, moves):
+            return min(moves)
+
+    register("corner", Corner)
+
+Имя стратегии в make_strategy() может нести параметр через дефис:
+"lookahead-3" - просмотр на 3 хода.
+"""
+import random
+
+from hints import HintSearch
+from solver import SolverCache, SolverLimitExceeded
+
+
+class Position:
+    """Позиция партии только для чтения: поле, зачеркнутые и последняя клетка"""
+
+    __slots__ = ("board", "crossed", "last")
+
+    def __init__(self, board, crossed, last):
+        self.board = board
+        self.crossed = crossed
+        self.last = last
+
+    @classmethod
+    def of(cls, engine):
+        return cls(engine.board, engine.crossed, engine.last)
+
+    @property
+    def remaining(self):
+        """Маска незачеркнутых клеток"""
+        return self.board.full & ~self.crossed
+
+    def legal_moves(self):
+        """Маска клеток, которые можно зачеркнуть следующим ходом"""
+        return self.board.compat[self.last] & ~self.crossed
+
+    def moves_from(self, cell):
+        """Маска ходов, которые будут доступны после хода в cell"""
+        return self.board.compat[cell] & ~self.crossed & ~(1 << cell)
+
+    def after(self, cell):
+        """Позиция после хода в cell (без проверки правил)"""
+        return Position(self.board, self.crossed | 1 << cell, cell)
+
+
+class Strategy:
+    """Базовая стратегия: случайный ход
+
+    reset(board) вызывается перед каждой партией, choose(position, moves) -
+    перед каждым ходом; moves - непустой список допустимых клеток.
+    """
+
+    name = "random"
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+
+    def reset(self, board):
+        pass
+
+    def choose(self, position, moves):
+        return self.rng.choice(moves)
+
+
+class RandomStrategy(Strategy):
+    """Случайный допустимый ход"""
+
+
+class GreedyStrategy(Strategy):
+    """Ход, после которого остается больше всего продолжений (при равенстве - случайный)"""
+
+    name = "greedy"
+
+    def choose(self, position, moves):
+        if len(moves) > 1:
+            options = [position.moves_from(cell).bit_count() for cell in moves]
+            best = max(options)
+            moves = [cell for cell, count in zip(moves, options) if count == best]
+        return self.rng.choice(moves)
+
+
+class LookaheadStrategy(Strategy):
+    """Ход с самой длинной цепочкой зачеркиваний в пределах depth ходов
+
+    Из равных по цепочке ходов выбирается клетка с наименьшим числом
+    продолжений (правило Варнсдорфа, как в решателе).
+    """
+
+    name = "lookahead"
+
+    def __init__(self, depth=2, rng=None):
+        super().__init__(rng)
+        if depth < 1:
+            raise ValueError("Глубина просмотра должна быть не меньше 1")
+        self.depth = depth
+        self.name = f"lookahead-{depth}"
+
+    def choose(self, position, moves):
+        if len(moves) == 1:
+            return moves[0]
+        search = HintSearch(position.board, position.crossed, position.last)
+        memo = {}
+        scores = []
+        for cell in moves:
+            reach = search.reach(position.crossed | 1 << cell, cell, self.depth - 1, memo)
+            scores.append((reach, -position.moves_from(cell).bit_count()))
+        best = max(scores)
+        return self.rng.choice([cell for cell, score in zip(moves, scores) if score == best])
+
+
+class PerfectStrategy(Strategy):
+    """Ходы точного решателя; если решатель не уложился в лимит - как greedy"""
+
+    name = "perfect"
+
+    # Лимит узлов решателя на поиск пути
+    MAX_NODES = 200000
+
+    def __init__(self, rng=None, solvers=None):
+        super().__init__(rng)
+        self.solvers = solvers if solvers is not None else SolverCache(max_nodes=self.MAX_NODES)
+        self.fallback = GreedyStrategy(self.rng)
+        self._plan = []
+        self._hopeless = False
+
+    def reset(self, board):
+        self._plan = []
+        self._hopeless = False
+
+    def choose(self, position, moves):
+        if not self._hopeless and (not self._plan or self._plan[-1] not in moves):
+            # Путь строится заново, если позиция ушла с запланированного;
+            # проигранную (или слишком сложную) позицию решатель больше не ищет
+            try:
+                path = self.solvers.solve(position.board, position.crossed, position.last)
+            except SolverLimitExceeded:
+                path = None
+            self._hopeless = path is None
+            self._plan = list(reversed(path)) if path else []
+        if self._plan:
+            return self._plan.pop()
+        return self.fallback.choose(position, moves)
+
+
+STRATEGIES = {
+    "random": RandomStrategy,
+    "greedy": GreedyStrategy,
+    "lookahead": LookaheadStrategy,
+    "perfect": PerfectStrategy,
+    "solver": PerfectStrategy,  # прежнее имя perfect в task1.py --strategy
+}
+
+
+def register(name, factory):
+    """Подключает стратегию: factory(rng) или factory(параметр, rng) -> Strategy"""
+    if "-" in name:
+        raise ValueError("Имя стратегии не может содержать дефис")
+    STRATEGIES[name] = factory
+
+
+def make_strategy(spec, rng=None):
+    """Стратегия по имени: "greedy", "lookahead-3" и т. п."""
+    name, _, argument = spec.partition("-")
+    factory = STRATEGIES.get(name)
+    if factory is None:
+        raise ValueError(f"Неизвестная стратегия: {spec}")
+    if argument:
+        try:
+            return factory(int(argument), rng=rng)
+        except TypeError:
+            raise ValueError(f"Стратегия {name} не принимает параметр") from None
+    return factory(rng=rng)
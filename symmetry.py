@@ -0,0 +1,106 @@
+"""Симметрии поля и канонический вид расклада
+
+Правила не меняются при 8 поворотах и отражениях квадратного поля, при
+любой перестановке цветов и при обмене кругов и квадратов. Канонический
+вид расклада - наименьшая (побайтно) из 8 геометрических разверток, в
+каждой из которых цвета перенумерованы по порядку первого появления, а
+форма первой клетки считается кругом. Эквивалентные поля имеют один и тот
+же канонический вид, поэтому результаты решателя и записи банка можно
+хранить один раз на класс эквивалентности.
+"""
+from functools import lru_cache
+
+from engine import Board, iter_cells
+
+
+@lru_cache(maxsize=None)
+def dihedral_maps(size):
+    """8 перестановок клеток поля: map[cell] - куда переходит клетка"""
+    last = size - 1
+    transforms = (
+        lambda r, c: (r, c),
+        lambda r, c: (c, last - r),
+        lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r),
+        lambda r, c: (r, last - c),
+        lambda r, c: (c, r),
+        lambda r, c: (last - r, c),
+        lambda r, c: (last - c, last - r),
+    )
+    maps = []
+    for transform in transforms:
+        cell_map = []
+        for cell in range(size * size):
+            row, col = transform(*divmod(cell, size))
+            cell_map.append(row * size + col)
+        maps.append(tuple(cell_map))
+    return tuple(maps)
+
+
+def map_mask(mask, cell_map):
+    """Маска клеток после перестановки cell_map"""
+    mapped = 0
+    for cell in iter_cells(mask):
+        mapped |= 1 << cell_map[cell]
+    return mapped
+
+
+def _layout(board, cell_map):
+    """Развертка поля после перестановки: цвета по первому появлению, первая форма - 0"""
+    cells = board.cells
+    colors = [0] * cells
+    shapes = [0] * cells
+    for cell in range(cells):
+        target = cell_map[cell]
+        colors[target] = board.colors[cell]
+        shapes[target] = board.shapes[cell]
+
+    renumber = {}
+    flip = shapes[0]
+    for cell in range(cells):
+        colors[cell] = renumber.setdefault(colors[cell], len(renumber))
+        shapes[cell] ^= flip
+    return colors, shapes
+
+
+class Canonical:
+    """Канонический вид поля и соответствие его клеток клеткам исходного"""
+
+    __slots__ = ("board", "key", "to_canonical", "from_canonical")
+
+    def __init__(self, board, key, to_canonical):
+        self.board = board                # каноническое поле
+        self.key = key                    # ключ класса эквивалентности (bytes)
+        self.to_canonical = to_canonical  # клетка исходного поля -> клетка канонического
+        from_canonical = [0] * len(to_canonical)
+        for cell, target in enumerate(to_canonical):
+            from_canonical[target] = cell
+        self.from_canonical = tuple(from_canonical)
+
+    def state(self, crossed, last):
+        """Позиция исходного поля в клетках канонического"""
+        return map_mask(crossed, self.to_canonical), self.to_canonical[last]
+
+    def path(self, cells):
+        """Путь на каноническом поле в клетках исходного"""
+        return [self.from_canonical[cell] for cell in cells]
+
+
+def canonicalize(board):
+    """Канонический вид поля (Canonical)"""
+    best = None
+    for cell_map in dihedral_maps(board.size):
+        colors, shapes = _layout(board, cell_map)
+        start = cell_map[board.start]
+        data = start.to_bytes(2, "little") + bytes(
+            color << 1 | shape for color, shape in zip(colors, shapes))
+        if best is None or data < best[0]:
+            best = (data, cell_map, colors, shapes, start)
+
+    key, cell_map, colors, shapes, start = best
+    return Canonical(Board(board.size, colors, shapes, start), key, cell_map)
+
+
+def canonical_key(board):
+    """Ключ класса эквивалентности поля: начальная клетка и раскладка канонического вида"""
+    return canonicalize(board).key
@@ -0,0 +1,141 @@
+"""Турнир стратегий на одинаковых полях
+
+Каждая стратегия играет одни и те же поля (поле i строится генератором с
+зерном "seed:i", так что набор полей не зависит от числа процессов).
+Партии раздаются процессам ProcessPoolExecutor порциями: стратегия и
+диапазон номеров полей; поля строятся в процессе-исполнителе.
+
+    python tournament.py --strategies random greedy lookahead-3 perfect --games 500
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import GameState
+from generator import BoardGenerator
+from headless import play_game
+from palette import DEFAULT_PALETTE
+from strategies import make_strategy
+
+DEFAULT_STRATEGIES = ("random", "greedy", "lookahead-2", "perfect")
+
+
+def tournament_board(size, n_colors, seed, index):
+    """Поле index турнира: одно и то же для всех стратегий и процессов"""
+    return BoardGenerator(size, n_colors, seed=f"{seed}:{index}").generate()
+
+
+def _run_chunk(spec, size, n_colors, seed, start, stop):
+    """Играет поля start..stop-1 стратегией spec; возвращает суммы по порции"""
+    totals = {"games": 0, "wins": 0, "crossed": 0, "moves": 0, "thinking": 0.0}
+    for index in range(start, stop):
+        board = tournament_board(size, n_colors, seed, index)
+        strategy = make_strategy(spec, random.Random(f"{seed}:{spec}:{index}"))
+        engine, thinking = play_game(board, strategy)
+        totals["games"] += 1
+        totals["wins"] += engine.state() == GameState.WIN
+        totals["crossed"] += engine.crossed_count
+        totals["moves"] += engine.moves
+        totals["thinking"] += thinking
+    return totals
+
+
+class TournamentResult:
+    """Итоги одной стратегии"""
+
+    def __init__(self, spec, cells):
+        self.spec = spec
+        self.cells = cells
+        self.games = 0
+        self.wins = 0
+        self.crossed = 0
+        self.moves = 0
+        self.thinking = 0.0
+
+    def add(self, totals):
+        self.games += totals["games"]
+        self.wins += totals["wins"]
+        self.crossed += totals["crossed"]
+        self.moves += totals["moves"]
+        self.thinking += totals["thinking"]
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def average_crossed(self):
+        return self.crossed / self.games if self.games else 0.0
+
+    @property
+    def move_time(self):
+        """Среднее время выбора хода, секунд"""
+        return self.thinking / self.moves if self.moves else 0.0
+
+    def as_dict(self):
+        return {
+            "strategy": self.spec,
+            "games": self.games,
+            "win_rate": self.win_rate,
+            "average_crossed": self.average_crossed,
+            "move_time": self.move_time,
+        }
+
+
+def run_tournament(strategies=DEFAULT_STRATEGIES, games=200, size=4, n_colors=None, seed=0,
+                   workers=None, chunk_size=25):
+    """Играет games полей каждой стратегией; возвращает список TournamentResult
+
+    workers - число процессов (None - по числу ядер, 0 - без пула).
+    """
+    if n_colors is None:
+        n_colors = len(DEFAULT_PALETTE)
+    for spec in strategies:
+        make_strategy(spec)  # ValueError для неизвестной стратегии сразу, а не в процессе
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    results = {spec: TournamentResult(spec, size * size) for spec in strategies}
+    jobs = [(spec, size, n_colors, seed, start, min(start + chunk_size, games))
+            for spec in strategies for start in range(0, games, chunk_size)]
+
+    if workers == 0:
+        for job in jobs:
+            results[job[0]].add(_run_chunk(*job))
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [(job[0], pool.submit(_run_chunk, *job)) for job in jobs]
+            for spec, future in futures:
+                results[spec].add(future.result())
+    return list(results.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Турнир стратегий на одинаковых полях")
+    parser.add_argument("--strategies", nargs="+", default=list(DEFAULT_STRATEGIES),
+                        help="стратегии: random, greedy, lookahead-K, perfect")
+    parser.add_argument("--games", type=int, default=200, help="полей на стратегию")
+    parser.add_argument("--grid-size", type=int, default=4, help="размер поля")
+    parser.add_argument("--colors", type=int, default=len(DEFAULT_PALETTE), help="число цветов")
+    parser.add_argument("--seed", type=int, default=0, help="зерно полей и стратегий")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="число процессов (0 - без пула)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = run_tournament(args.strategies, args.games, args.grid_size, args.colors,
+                             args.seed, args.workers)
+    elapsed = time.perf_counter() - started
+
+    cells = args.grid_size * args.grid_size
+    print(f"{'стратегия':16} {'побед':>8} {'зачеркнуто':>12} {'мкс на ход':>12}")
+    for result in results:
+        print(f"{result.spec:16} {result.win_rate:>8.1%} "
+              f"{result.average_crossed:>7.1f}/{cells:<4} {result.move_time * 1e6:>12,.1f}")
+    print(f"\nПолей {args.grid_size}x{args.grid_size}: {args.games}, время {elapsed:.1f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Видимая область большого поля
+
+Элементы холста создаются только для клеток, попадающих в окно просмотра
+(с запасом overscan клеток по краям), поэтому число элементов зависит от
+размера окна, а не от размера поля.
+"""
+
+
+def visible_range(start, stop, size, cell_size, margin=0, overscan=1):
+    """Индексы строк (или столбцов), видимых в отрезке [start, stop) пикселей"""
+    first = int((start - margin) // cell_size) - overscan
+    last = int((stop - margin) // cell_size) + overscan
+    return range(max(0, first), min(size - 1, last) + 1)
+
+
+def visible_cells(x0, y0, x1, y1, size, cell_size, margin=0, overscan=1):
+    """Множество индексов клеток, видимых в прямоугольнике холста"""
+    rows = visible_range(y0, y1, size, cell_size, margin, overscan)
+    cols = visible_range(x0, x1, size, cell_size, margin, overscan)
+    return {row * size + col for row in rows for col in cols}